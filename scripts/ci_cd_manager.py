@@ -13,16 +13,26 @@ Master script that orchestrates the entire CI/CD pipeline:
 
 import os
 import sys
-import json
+import stat
 import time
 import subprocess
 import argparse
-import shutil
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
 from dataclasses import dataclass
 
+# Modules only a pipeline run needs are imported where they are used, so
+# --help and argument errors stay quick
+
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Locate a tool on PATH, remembering the answer for later lookups"""
+    import shutil
+    return shutil.which(tool)
+
 @dataclass
 class BuildConfig:
     platform: str = "x64"
@@ -33,14 +43,76 @@ class BuildConfig:
     enable_packaging: bool = True
     parallel_jobs: int = 4
     
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[BuildConfig], bool]
+    required: bool = True
+    parallel: bool = False  # may run alongside adjacent parallel stages
+    enabled: Optional[Callable[[BuildConfig], bool]] = None
+    
 class CICDManager:
+    # Inputs whose contents determine the build output
+    BUILD_INPUTS = ("src", "include", "tests", "third_party", "CMakeLists.txt", "vcpkg.json")
+    POWERSHELL_PREFIX = ("powershell", "-ExecutionPolicy", "Bypass", "-File")
+    
     def __init__(self, project_root: str):
-        self.project_root = Path(project_root)
+        self.project_root = Path(project_root).resolve()
         self.scripts_dir = self.project_root / "scripts"
+        
+        # Stage scripts never move during a run, so resolve them once
+        self._build_script = str(self.scripts_dir / "build_system.ps1")
+        self._integration_script = str(self.scripts_dir / "run_integration_tests.py")
+        self._perf_script = str(self.scripts_dir / "performance_tests.py")
+        self._build_root = os.fspath(self.project_root / "build")
+        self._reports_dir = os.fspath(self.project_root / "reports")
+        self._artifacts_dir = os.fspath(self.project_root / "artifacts")
+        self._report_paths = {
+            name: os.path.join(self._reports_dir, f"{name}.txt")
+            for name in ("build", "unit_tests", "integration_tests",
+                         "security_scan", "performance_tests", "packaging")
+        }
+        
+        # Python stages that only need an interpreter run in this one
+        if str(self.scripts_dir) not in sys.path:
+            sys.path.insert(0, str(self.scripts_dir))
+        self._in_process_lock = threading.Lock()
+        
         self.logger = self._setup_logging()
         self.build_artifacts = {}
+        self._report_index: Dict[str, dict] = {}
+        self.build_cache_path = self.project_root / ".ci_cache" / "builds.json"
+        
+        # Pipeline stages in execution order. Adjacent parallel stages only
+        # consume the built artifacts and run concurrently. The security scan
+        # and packaging call their script's main() in this process (see
+        # _run_script_in_process), so unlike the subprocess stages they run
+        # without a timeout.
+        self.stages = [
+            Stage("Environment setup", self._setup_environment),
+            Stage("Build", self._run_build),
+            Stage("Unit tests", self._run_unit_tests,
+                  enabled=lambda c: c.enable_tests),
+            Stage("Integration tests", self._run_integration_tests,
+                  enabled=lambda c: c.enable_tests),
+            Stage("Security scan", self._run_security_scan,
+                  required=False, parallel=True,
+                  enabled=lambda c: c.enable_security_scan),
+            Stage("Performance tests", self._run_performance_tests,
+                  required=False, parallel=True,
+                  enabled=lambda c: c.enable_performance_test),
+            Stage("Static analysis", self._run_static_analysis,
+                  required=False, parallel=True),
+            Stage("Packaging", self._run_packaging,
+                  enabled=lambda c: c.enable_packaging),
+            Stage("Final verification", self._final_verification),
+        ]
         
     def _setup_logging(self) -> logging.Logger:
+        import atexit
+        import logging.handlers
+        import queue
+        
         logger = logging.getLogger('mcp_cicd')
         logger.setLevel(logging.INFO)
         
@@ -50,21 +122,50 @@ class CICDManager:
             '[%(asctime)s] [%(levelname)s] %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
         
-        # File handler
-        log_file = self.project_root / "ci_cd.log"
-        file_handler = logging.FileHandler(log_file)
+        # Buffer for the log file, so records reach it in batches. The file
+        # itself is only opened once a pipeline run starts.
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR
+        )
+        
+        # Format and emit records on a background thread so pipeline stages
+        # never block on log I/O. The listener runs for the life of the
+        # process and is stopped at exit, after handling what is queued.
+        self._log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, self._log_buffer, console_handler,
+            respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        return logger
+    
+    def _open_log_file(self):
+        """Attach the log file to the buffer, writing out anything held so far"""
+        if self._log_buffer.target is not None:
+            return
+        
+        file_handler = logging.FileHandler(self.project_root / "ci_cd.log")
         file_formatter = logging.Formatter(
             '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-        
-        return logger
+        self._log_buffer.setTarget(file_handler)
+    
+    def _flush_logging(self):
+        """Drain queued log records and flush buffered ones to the log file"""
+        # The listener marks each record done once handled, so this waits for
+        # the queue to drain while leaving it running for later records
+        self._log_queue.join()
+        self._log_buffer.flush()
     
     def run_full_pipeline(self, config: BuildConfig) -> bool:
         """Run the complete CI/CD pipeline"""
+        self._open_log_file()
         self.logger.info("="*60)
         self.logger.info("STARTING MCP DEBUGGER CI/CD PIPELINE")
         self.logger.info("="*60)
@@ -74,41 +175,21 @@ class CICDManager:
         pipeline_start = time.time()
         
         try:
-            # Stage 1: Environment Setup
-            if not self._setup_environment(config):
-                return False
-            
-            # Stage 2: Build
-            if not self._run_build(config):
-                return False
-            
-            # Stage 3: Unit Tests
-            if config.enable_tests and not self._run_unit_tests(config):
-                return False
-            
-            # Stage 4: Integration Tests
-            if config.enable_tests and not self._run_integration_tests(config):
-                return False
-            
-            # Stage 5: Security Scan
-            if config.enable_security_scan and not self._run_security_scan(config):
-                self.logger.warning("Security scan found issues, but continuing...")
-            
-            # Stage 6: Performance Tests
-            if config.enable_performance_test and not self._run_performance_tests(config):
-                self.logger.warning("Performance tests had issues, but continuing...")
-            
-            # Stage 7: Static Analysis
-            if not self._run_static_analysis(config):
-                self.logger.warning("Static analysis had issues, but continuing...")
-            
-            # Stage 8: Packaging
-            if config.enable_packaging and not self._run_packaging(config):
-                return False
+            stages = [
+                stage for stage in self.stages
+                if stage.enabled is None or stage.enabled(config)
+            ]
             
-            # Stage 9: Final Verification
-            if not self._final_verification(config):
-                return False
+            i = 0
+            while i < len(stages):
+                end = i + 1
+                if stages[i].parallel:
+                    while end < len(stages) and stages[end].parallel:
+                        end += 1
+                
+                if not self._run_stage_group(stages[i:end], config):
+                    return False
+                i = end
             
             pipeline_duration = time.time() - pipeline_start
             self.logger.info("="*60)
@@ -121,6 +202,155 @@ class CICDManager:
         except Exception as e:
             self.logger.error(f"Pipeline failed with exception: {e}")
             return False
+        
+        finally:
+            self._flush_logging()
+    
+    def _run_and_report(self, cmd: List[str], report_path: str, timeout: int,
+                        cwd: Optional[Union[str, Path]] = None) -> subprocess.CompletedProcess:
+        """Run a command and save its return code and output to a report file"""
+        started = time.time()
+        result = subprocess.run(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout
+        )
+        
+        self._write_report(report_path, result.returncode, result.stdout, result.stderr)
+        self._index_report(report_path, result.returncode,
+                           len(result.stdout), len(result.stderr), started)
+        return result
+    
+    def _run_script_in_process(self, module_name: str, argv: List[str],
+                               report_path: str) -> subprocess.CompletedProcess:
+        """Run a sibling script's main() in this interpreter and report its output"""
+        import contextlib
+        import importlib
+        import io
+        
+        stdout, stderr = io.StringIO(), io.StringIO()
+        started = time.time()
+        
+        # Redirection swaps the process-wide sys.stdout/sys.stderr, so only
+        # one script may run this way at a time
+        with self._in_process_lock:
+            module = importlib.import_module(module_name)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    returncode = module.main(argv)
+                except SystemExit as e:  # argparse exits on bad arguments
+                    returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        
+        result = subprocess.CompletedProcess(
+            [module_name, *argv], returncode,
+            stdout.getvalue().encode(), stderr.getvalue().encode()
+        )
+        self._write_report(report_path, result.returncode, result.stdout, result.stderr)
+        self._index_report(report_path, result.returncode,
+                           len(result.stdout), len(result.stderr), started)
+        return result
+    
+    def _index_report(self, report_path: str, returncode: int,
+                      stdout_bytes: int, stderr_bytes: int, started: float):
+        """Record a condensed stage result for the build summary"""
+        self._report_index[os.path.splitext(os.path.basename(report_path))[0]] = {
+            "returncode": returncode,
+            "stdout_bytes": stdout_bytes,
+            "stderr_bytes": stderr_bytes,
+            "duration_s": round(time.time() - started, 3),
+            "path": os.path.relpath(report_path, self.project_root)
+        }
+    
+    def _write_report(self, report_path: str, returncode: int, stdout: bytes, stderr: bytes):
+        """Write a stage report in a single (vectored where supported) write"""
+        chunks = [
+            b"Return code: %d\nSTDOUT:\n" % returncode, stdout,
+            b"\nSTDERR:\n", stderr, b"\n"
+        ]
+        fd = os.open(report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'writev'):
+                written = os.writev(fd, chunks)
+            else:
+                written = 0
+            
+            # Finish anything a short (or unavailable) writev left behind
+            if written < sum(map(len, chunks)):
+                payload = memoryview(b"".join(chunks))[written:]
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
+    
+    def _run_streamed(self, cmd: List[str], report_path: str, timeout: int,
+                      cwd: Optional[Union[str, Path]] = None) -> int:
+        """Run a long command with its output going straight to a report file"""
+        started = time.time()
+        with open(report_path, 'wb', buffering=0) as report:
+            process = subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                stdout=report,
+                stderr=subprocess.STDOUT
+            )
+            try:
+                returncode = self._wait_for_exit(process, timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            
+            output_bytes = report.tell()
+            report.write(b"\n=== returncode=%d ===\n" % returncode)
+        
+        # stderr is interleaved into stdout for streamed stages
+        self._index_report(report_path, returncode, output_bytes, 0, started)
+        return returncode
+    
+    def _wait_for_exit(self, process: subprocess.Popen, timeout: int) -> int:
+        """Wait for a child to exit, sleeping on a pidfd where the OS has one"""
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+            
+            if pidfd is not None:
+                import selectors
+                try:
+                    with selectors.DefaultSelector() as selector:
+                        selector.register(pidfd, selectors.EVENT_READ)
+                        if not selector.select(timeout):
+                            raise subprocess.TimeoutExpired(process.args, timeout)
+                finally:
+                    os.close(pidfd)
+                return process.wait()
+        
+        # Popen.wait polls with a backoff sleep when given a timeout
+        return process.wait(timeout=timeout)
+    
+    def _run_stage_group(self, group: List[Stage], config: BuildConfig) -> bool:
+        """Run a group of stages, concurrently if there is more than one"""
+        if len(group) == 1:
+            results = [(group[0], group[0].run(config))]
+        else:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            with ThreadPoolExecutor(max_workers=max(1, config.parallel_jobs)) as executor:
+                futures = {executor.submit(stage.run, config): stage for stage in group}
+                results = [(futures[f], f.result()) for f in as_completed(futures)]
+        
+        success = True
+        for stage, ok in results:
+            if ok:
+                continue
+            if stage.required:
+                success = False
+            else:
+                self.logger.warning(f"{stage.name} had issues, but continuing...")
+        
+        return success
     
     def _setup_environment(self, config: BuildConfig) -> bool:
         """Setup build environment"""
@@ -131,8 +361,13 @@ class CICDManager:
         if os.name == 'nt':
             required_tools.append("cl")  # MSVC compiler
         
+        # Probe PATH for every tool at once
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(required_tools)) as executor:
+            tool_paths = dict(zip(required_tools, executor.map(_which, required_tools)))
+        
         for tool in required_tools:
-            if not shutil.which(tool):
+            if not tool_paths[tool]:
                 self.logger.error(f"Required tool not found: {tool}")
                 return False
         
@@ -153,12 +388,27 @@ class CICDManager:
         self.logger.info("Stage 2: Building project...")
         
         try:
-            # Use PowerShell build system
-            build_script = self.scripts_dir / "build_system.ps1"
+            build_report = self._report_paths["build"]
+            
+            # Reuse the binary from an earlier build of identical sources, as
+            # long as no other build has replaced it since
+            cache_key = self._build_cache_key(config)
+            build_cache = self._load_build_cache()
+            cached = build_cache.get(cache_key)
+            signature = cached and self._binary_signature(cached["binary_path"])
+            if signature and signature == cached.get("signature"):
+                started = time.time()
+                message = b"Sources unchanged, reused cached build: %s\n" % os.fsencode(cached["binary_path"])
+                self._write_report(build_report, 0, message, b"")
+                self._index_report(build_report, 0, len(message), 0, started)
+                
+                self.build_artifacts["binary"] = cached["binary_path"]
+                self.logger.info("✓ Sources unchanged, reusing cached build")
+                return True
             
+            # Use PowerShell build system
             cmd = [
-                "powershell", "-ExecutionPolicy", "Bypass",
-                "-File", str(build_script),
+                *self.POWERSHELL_PREFIX, self._build_script,
                 "build",
                 "-Config", config.config,
                 "-Platform", config.platform
@@ -167,25 +417,33 @@ class CICDManager:
             if not config.enable_tests:
                 cmd.append("-SkipTests")
             
-            result = subprocess.run(
+            returncode = self._run_streamed(
                 cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minutes
+                build_report,
+                timeout=600,  # 10 minutes
+                cwd=self.project_root
             )
             
-            if result.returncode != 0:
-                self.logger.error(f"Build failed: {result.stderr}")
+            if returncode != 0:
+                self.logger.error(f"Build failed, see {build_report}")
                 return False
             
             # Check for build artifacts
-            binary_path = self.project_root / "build" / config.platform / "src" / "cli" / config.config / "mcp-debugger.exe"
-            if not binary_path.exists():
+            binary_path = os.path.join(
+                self._build_root, config.platform, "src", "cli", config.config,
+                "mcp-debugger.exe"
+            )
+            if not os.path.isfile(binary_path):
                 self.logger.error("Main binary not found after build")
                 return False
             
-            self.build_artifacts["binary"] = str(binary_path)
+            self.build_artifacts["binary"] = binary_path
+            build_cache[cache_key] = {
+                "binary_path": binary_path,
+                "signature": self._binary_signature(binary_path),
+                "timestamp": time.time()
+            }
+            self._save_build_cache(build_cache)
             self.logger.info("✓ Build completed successfully")
             return True
             
@@ -196,29 +454,79 @@ class CICDManager:
             self.logger.error(f"Build failed: {e}")
             return False
     
+    def _compute_source_fingerprint(self) -> str:
+        """Fingerprint the build inputs by path, size and modification time"""
+        import hashlib
+        
+        digest = hashlib.blake2b(digest_size=16)
+        
+        def walk(path: str):
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path)
+                elif entry.is_file():
+                    add(entry.path, entry.stat())
+        
+        def add(path: str, st: os.stat_result):
+            rel = os.path.relpath(path, self.project_root)
+            digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        
+        for name in self.BUILD_INPUTS:
+            path = os.path.join(self.project_root, name)
+            if os.path.isdir(path):
+                walk(path)
+            elif os.path.isfile(path):
+                add(path, os.stat(path))
+        
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _binary_signature(path: str) -> Optional[List[int]]:
+        """Size and modification time of a built binary, or None if it is gone"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+    
+    def _build_cache_key(self, config: BuildConfig) -> str:
+        fingerprint = self._compute_source_fingerprint()
+        return f"{fingerprint}:{config.config}:{config.platform}:{config.enable_tests}"
+    
+    def _load_build_cache(self) -> Dict[str, dict]:
+        import json
+        try:
+            with open(self.build_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_build_cache(self, build_cache: Dict[str, dict]):
+        import json
+        try:
+            self.build_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.build_cache_path, 'w') as f:
+                json.dump(build_cache, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not update build cache: {e}")
+    
     def _run_unit_tests(self, config: BuildConfig) -> bool:
         """Run unit tests"""
         self.logger.info("Stage 3: Running unit tests...")
         
         try:
-            build_dir = self.project_root / "build" / config.platform
+            build_dir = os.path.join(self._build_root, config.platform)
             
-            # Run CTest
-            result = subprocess.run(
+            # Run CTest and save test results
+            result = self._run_and_report(
                 ["ctest", "--output-on-failure", "--build-config", config.config],
-                cwd=build_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes
+                self._report_paths["unit_tests"],
+                timeout=300,  # 5 minutes
+                cwd=build_dir
             )
             
-            # Save test results
-            test_report = self.project_root / "reports" / "unit_tests.txt"
-            with open(test_report, 'w') as f:
-                f.write(f"Return code: {result.returncode}\\n")
-                f.write(f"STDOUT:\\n{result.stdout}\\n")
-                f.write(f"STDERR:\\n{result.stderr}\\n")
-            
             if result.returncode != 0:
                 self.logger.error("Unit tests failed")
                 return False
@@ -235,7 +543,6 @@ class CICDManager:
         self.logger.info("Stage 4: Running integration tests...")
         
         try:
-            test_script = self.scripts_dir / "run_integration_tests.py"
             binary_path = self.build_artifacts.get("binary")
             
             if not binary_path:
@@ -243,27 +550,19 @@ class CICDManager:
                 return False
             
             cmd = [
-                "python", str(test_script),
+                "python", self._integration_script,
                 "--binary", binary_path,
                 "--platform", config.platform,
                 "--config", config.config
             ]
             
-            result = subprocess.run(
+            result = self._run_and_report(
                 cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minutes
+                self._report_paths["integration_tests"],
+                timeout=600,  # 10 minutes
+                cwd=self.project_root
             )
             
-            # Save test results
-            test_report = self.project_root / "reports" / "integration_tests.txt"
-            with open(test_report, 'w') as f:
-                f.write(f"Return code: {result.returncode}\\n")
-                f.write(f"STDOUT:\\n{result.stdout}\\n")
-                f.write(f"STDERR:\\n{result.stderr}\\n")
-            
             if result.returncode != 0:
                 self.logger.warning("Some integration tests failed, but continuing...")
             else:
@@ -280,22 +579,14 @@ class CICDManager:
         self.logger.info("Stage 5: Running security scan...")
         
         try:
-            security_script = self.scripts_dir / "security_scan.py"
-            
-            result = subprocess.run(
-                ["python", str(security_script), "--project-root", str(self.project_root)],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes
+            result = self._run_script_in_process(
+                "security_scan",
+                # Forking scan workers from this multithreaded process could
+                # deadlock them, so the scan stays in the stage's own thread
+                ["--project-root", str(self.project_root), "--jobs", "1"],
+                self._report_paths["security_scan"]
             )
             
-            # Save security report
-            security_report = self.project_root / "reports" / "security_scan.txt"
-            with open(security_report, 'w') as f:
-                f.write(f"Return code: {result.returncode}\\n")
-                f.write(f"STDOUT:\\n{result.stdout}\\n")
-                f.write(f"STDERR:\\n{result.stderr}\\n")
-            
             if result.returncode != 0:
                 self.logger.warning("Security scan found issues")
                 return False
@@ -312,7 +603,6 @@ class CICDManager:
         self.logger.info("Stage 6: Running performance tests...")
         
         try:
-            perf_script = self.scripts_dir / "performance_tests.py"
             binary_path = self.build_artifacts.get("binary")
             
             if not binary_path:
@@ -320,28 +610,20 @@ class CICDManager:
                 return False
             
             cmd = [
-                "python", str(perf_script),
+                "python", self._perf_script,
                 "--binary", binary_path,
                 "--iterations", "50",  # Reduced for CI
-                "--output", str(self.project_root / "reports")
+                "--output", self._reports_dir
             ]
             
-            result = subprocess.run(
+            returncode = self._run_streamed(
                 cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=900  # 15 minutes
+                self._report_paths["performance_tests"],
+                timeout=900,  # 15 minutes
+                cwd=self.project_root
             )
             
-            # Save performance report
-            perf_report = self.project_root / "reports" / "performance_tests.txt"
-            with open(perf_report, 'w') as f:
-                f.write(f"Return code: {result.returncode}\\n")
-                f.write(f"STDOUT:\\n{result.stdout}\\n")
-                f.write(f"STDERR:\\n{result.stderr}\\n")
-            
-            if result.returncode != 0:
+            if returncode != 0:
                 self.logger.warning("Performance tests had issues")
                 return False
             
@@ -370,34 +652,32 @@ class CICDManager:
         self.logger.info("Stage 8: Creating packages...")
         
         try:
-            package_script = self.scripts_dir / "package.py"
-            artifacts_dir = self.project_root / "artifacts"
-            
-            cmd = [
-                "python", str(package_script),
+            argv = [
                 "--platform", config.platform,
                 "--config", config.config,
-                "--output", str(artifacts_dir)
+                "--output", self._artifacts_dir,
+                # Pipeline packages are consumed internally, favour speed over size
+                "--compression", "stored"
             ]
             
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes
+            result = self._run_script_in_process(
+                "package",
+                argv,
+                self._report_paths["packaging"]
             )
             
             if result.returncode != 0:
-                self.logger.error(f"Packaging failed: {result.stderr}")
+                self.logger.error(
+                    f"Packaging failed: {result.stderr.decode(errors='replace')}"
+                )
                 return False
             
             # Check for package artifacts
             package_name = f"MCP-Debugger-1.0.0-{config.platform}.zip"
-            package_path = artifacts_dir / package_name
+            package_path = os.path.join(self._artifacts_dir, package_name)
             
-            if package_path.exists():
-                self.build_artifacts["package"] = str(package_path)
+            if os.path.isfile(package_path):
+                self.build_artifacts["package"] = package_path
                 self.logger.info(f"✓ Package created: {package_name}")
             else:
                 self.logger.warning("Package file not found, but packaging reported success")
@@ -422,10 +702,18 @@ class CICDManager:
                 self.logger.error(f"Missing required artifact: {artifact}")
                 return False
             
-            path = Path(self.build_artifacts[artifact])
-            if not path.exists():
+            # One stat answers both the existence and the size check
+            path = self.build_artifacts[artifact]
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 self.logger.error(f"Artifact file not found: {path}")
                 return False
+            if st.st_size == 0:
+                self.logger.error(f"Artifact file is empty: {path}")
+                return False
         
         # Generate build summary
         self._generate_build_summary(config)
@@ -444,16 +732,23 @@ class CICDManager:
             },
             "artifacts": self.build_artifacts,
             "reports": {
+                "build": "reports/build.txt",
                 "unit_tests": "reports/unit_tests.txt",
                 "integration_tests": "reports/integration_tests.txt",
                 "security_scan": "reports/security_scan.txt",
                 "performance_tests": "reports/performance_tests.txt"
-            }
+            },
+            "stages": self._report_index
         }
         
-        summary_path = self.project_root / "artifacts" / "build_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        summary_path = Path(self._artifacts_dir, "build_summary.json")
+        try:
+            import orjson
+            payload = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+        except ImportError:  # orjson is optional
+            import json
+            payload = json.dumps(summary, indent=2, ensure_ascii=False).encode()
+        summary_path.write_bytes(payload)
         
         self.logger.info(f"Build summary saved to: {summary_path}")
 
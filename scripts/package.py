@@ -18,10 +18,27 @@ import json
 import argparse
 import subprocess
 import tempfile
+import string
+import functools
+import contextlib
+import mmap
+import io
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    from zlib_ng import zlib_ng
+except ImportError:  # optional, archives are checksummed with the stdlib zlib
+    zlib_ng = None
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
+
 # =======================================
 # Package Configuration
 # =======================================
@@ -44,19 +61,291 @@ PACKAGE_CONFIG = {
     ]
 }
 
+PROJECT_ROOT = Path(__file__).parent.parent
+
+PACKAGE_NAME = PACKAGE_CONFIG["name"]
+PACKAGE_VERSION = PACKAGE_CONFIG["version"]
+PLUGIN_SUFFIXES = {"x64": "dp64", "x86": "dp32"}
+
+# Shipped when the repository has no sample-config.json
+DEFAULT_CONFIG = {
+    "api_configs": {
+        "claude": {
+            "model": "claude-3-sonnet-20240229",
+            "endpoint": "https://api.anthropic.com/v1/messages",
+            "timeout_ms": 30000,
+            "max_retries": 3,
+            "validate_ssl": True
+        }
+    },
+    "debug_config": {
+        "x64dbg_path": "C:\\x64dbg\\release\\x64\\x64dbg.exe",
+        "auto_connect": False,
+        "connection_timeout_ms": 5000
+    },
+    "log_config": {
+        "level": 1,
+        "output_path": "mcp-debugger.log",
+        "console_output": True,
+        "file_output": True
+    },
+    "security_config": {
+        "credential_store_path": "credentials.encrypted",
+        "require_api_key_validation": True,
+        "encrypt_credentials": True
+    }
+}
+
+def parse_compression(value: str) -> Tuple[int, Optional[int]]:
+    """Parse a compression spec: 'stored', 'deflate' or 'deflate:<level>'"""
+    method, _, level = value.partition(":")
+    if method == "stored" and not level:
+        return zipfile.ZIP_STORED, None
+    if method == "deflate":
+        if not level:
+            return zipfile.ZIP_DEFLATED, None
+        if level.isdigit() and 0 <= int(level) <= 9:
+            return zipfile.ZIP_DEFLATED, int(level)
+    raise argparse.ArgumentTypeError(
+        f"invalid compression '{value}' (expected stored, deflate or deflate:0-9)"
+    )
+
+# =======================================
+# Installer Templates
+# =======================================
+class InstallerTemplate(string.Template):
+    """Template where only ${name} is a placeholder; bare $ belongs to PowerShell"""
+    pattern = r"""
+    \$\{(?P<braced>[_a-z][_a-z0-9]*)\}|
+    (?P<escaped>(?!))|(?P<named>(?!))|(?P<invalid>(?!))
+    """
+
+# Windows batch installer
+INSTALL_BAT_TEMPLATE = InstallerTemplate("""@echo off
+REM MCP Debugger Installation Script
+echo Installing MCP Debugger ${version}...
+
+REM Create installation directory
+set INSTALL_DIR=%ProgramFiles%\\MCPDebugger
+if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
+
+REM Copy files
+echo Copying files...
+xcopy /E /I /Y bin "%INSTALL_DIR%\\bin\\"
+xcopy /E /I /Y config "%INSTALL_DIR%\\config\\"
+xcopy /E /I /Y docs "%INSTALL_DIR%\\docs\\"
+
+REM Add to PATH
+echo Adding to PATH...
+setx PATH "%PATH%;%INSTALL_DIR%\\bin" /M
+
+REM Install x64dbg plugin
+set PLUGIN_SRC=%~dp0plugins\\mcp_debugger.${plugin_suffix}
+echo.
+echo To install x64dbg plugin:
+echo 1. Copy %PLUGIN_SRC% to your x64dbg\\plugins\\ directory
+echo 2. Restart x64dbg
+echo.
+
+REM Create shortcuts
+echo Creating shortcuts...
+set DESKTOP=%USERPROFILE%\\Desktop
+powershell "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP%\\MCP Debugger.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\\bin\\mcp-debugger.exe'; $Shortcut.Save()"
+
+echo.
+echo Installation complete!
+echo Run 'mcp-debugger --help' to get started.
+echo.
+pause
+""")
+
+# PowerShell installer (more advanced)
+INSTALL_PS1_TEMPLATE = InstallerTemplate('''# MCP Debugger PowerShell Installer
+param(
+    [string]$InstallPath = "$env:ProgramFiles\\MCPDebugger",
+    [switch]$AddToPath = $true,
+    [switch]$CreateShortcuts = $true
+)
+
+Write-Host "Installing MCP Debugger ${version}..." -ForegroundColor Cyan
+
+# Check if running as administrator
+if (-NOT ([Security.Principal.WindowsPrincipal] [Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole([Security.Principal.WindowsBuiltInRole] "Administrator")) {
+    Write-Host "Warning: Not running as Administrator. Some features may not work." -ForegroundColor Yellow
+}
+
+# Create installation directory
+if (!(Test-Path $InstallPath)) {
+    New-Item -Path $InstallPath -ItemType Directory -Force | Out-Null
+}
+
+# Copy files
+Write-Host "Copying files to $InstallPath..." -ForegroundColor Green
+Copy-Item -Path "bin\\*" -Destination "$InstallPath\\bin\\" -Recurse -Force
+Copy-Item -Path "config\\*" -Destination "$InstallPath\\config\\" -Recurse -Force
+Copy-Item -Path "docs\\*" -Destination "$InstallPath\\docs\\" -Recurse -Force
+
+# Add to PATH
+if ($AddToPath) {
+    Write-Host "Adding to system PATH..." -ForegroundColor Green
+    $currentPath = [Environment]::GetEnvironmentVariable("PATH", "Machine")
+    if ($currentPath -notlike "*$InstallPath\\bin*") {
+        [Environment]::SetEnvironmentVariable("PATH", "$currentPath;$InstallPath\\bin", "Machine")
+    }
+}
+
+# Create shortcuts
+if ($CreateShortcuts) {
+    Write-Host "Creating desktop shortcut..." -ForegroundColor Green
+    $WshShell = New-Object -comObject WScript.Shell
+    $Shortcut = $WshShell.CreateShortcut("$env:USERPROFILE\\Desktop\\MCP Debugger.lnk")
+    $Shortcut.TargetPath = "$InstallPath\\bin\\mcp-debugger.exe"
+    $Shortcut.WorkingDirectory = "$InstallPath\\bin"
+    $Shortcut.Save()
+}
+
+Write-Host "Installation complete!" -ForegroundColor Green
+Write-Host "Run 'mcp-debugger --help' to get started." -ForegroundColor Cyan
+''')
+
+def _render_installer(template: InstallerTemplate, plugin_suffix: str) -> bytes:
+    text = template.substitute(version=PACKAGE_VERSION, plugin_suffix=plugin_suffix)
+    return text.replace("\n", "\r\n").encode("utf-8")  # Windows line endings
+
+# The installers only vary by platform, so render them once at import
+INSTALL_BAT = {
+    platform: _render_installer(INSTALL_BAT_TEMPLATE, suffix)
+    for platform, suffix in PLUGIN_SUFFIXES.items()
+}
+INSTALL_PS1 = {
+    platform: _render_installer(INSTALL_PS1_TEMPLATE, suffix)
+    for platform, suffix in PLUGIN_SUFFIXES.items()
+}
+
+# Members smaller than this are stored uncompressed; deflate saves next to
+# nothing on them and costs a compressor setup per member
+STORE_BELOW_BYTES = 4 * 1024
+
+# Formats that are already compressed gain nothing from deflate
+PRECOMPRESSED_SUFFIXES = (
+    ".zip", ".7z", ".gz", ".xz", ".bz2", ".zst", ".cab", ".msi",
+    ".png", ".jpg", ".jpeg", ".gif", ".ico",
+)
+
+# Archive members get a fixed timestamp (the earliest zip can represent) so
+# rebuilding an unchanged tree yields an identical archive
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+ZIP_COPY_BUFFER = 1024 * 1024
+ZIP_MMAP_THRESHOLD = 4 * 1024 * 1024  # larger members are memory-mapped
+ZIP_IN_MEMORY_LIMIT = 32 * 1024 * 1024  # larger packages are zipped on disk
+
+# Written by every run, so copies left behind by an earlier run into the same
+# output directory are not enumerated as package contents
+GENERATED_FILES = frozenset({"manifest.json", "version.json"})
+
+def _json_bytes(data: dict) -> bytes:
+    """Serialize data as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def _write_json(path: Path, data: dict) -> int:
+    """Serialize data as indented JSON and write it in one go, returning its size"""
+    payload = _json_bytes(data)
+    path.write_bytes(payload)
+    return len(payload)
+
+@functools.lru_cache(maxsize=None)
+def _default_config_bytes() -> bytes:
+    """DEFAULT_CONFIG serialized once for every package built in this process"""
+    return _json_bytes(DEFAULT_CONFIG)
+
+@functools.lru_cache(maxsize=None)
+def _git_hash(project_root: str) -> str:
+    """Current git commit hash, looked up once per project root"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=project_root
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return "unknown"
+
+@functools.lru_cache(maxsize=None)
+def _cmake_version() -> str:
+    """CMake version line, looked up once per process"""
+    try:
+        result = subprocess.run(
+            ["cmake", "--version"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            return result.stdout.splitlines()[0]
+    except Exception:
+        pass
+    return "unknown"
+
+class HashingReader:
+    """File wrapper that hashes everything read through it"""
+    
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.digest = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+@contextlib.contextmanager
+def _zip_crc32():
+    """Checksum archive members with zlib-ng's crc32 while the block runs
+    
+    zlib-ng uses the carry-less multiply (PCLMULQDQ/VPCLMULQDQ) fold where
+    available. zipfile looks crc32 up as a module global, so it is swapped in
+    for the duration of one archive and put back afterwards.
+    """
+    if zlib_ng is None:
+        yield
+        return
+    
+    stdlib_crc32 = zipfile.crc32
+    zipfile.crc32 = zlib_ng.crc32
+    try:
+        yield
+    finally:
+        zipfile.crc32 = stdlib_crc32
+
 class PackageBuilder:
-    def __init__(self, platform: str, config: str, output_dir: str):
+    def __init__(self, platform: str, config: str, output_dir: str,
+                 compression: Tuple[int, Optional[int]] = (zipfile.ZIP_DEFLATED, 6)):
         self.platform = platform
         self.config = config
         self.output_dir = Path(output_dir)
-        self.project_root = Path(__file__).parent.parent
+        self.compression, self.compress_level = compression
+        self.project_root = PROJECT_ROOT
         self.build_dir = self.project_root / "build" / platform
         self.logger = self._setup_logging()
         
         # Package info
-        self.package_name = f"{PACKAGE_CONFIG['name']}-{PACKAGE_CONFIG['version']}-{platform}"
+        self.package_name = f"{PACKAGE_NAME}-{PACKAGE_VERSION}-{platform}"
         self.package_dir = self.output_dir / self.package_name
         
+        # (path, relative path, size) of every package file, sorted by
+        # relative path; filled in by _create_manifests
+        self._enumerated_files: Optional[List[Tuple[str, str, int]]] = None
+        
+        # Package manifest, written as the last archive member once every
+        # other member's hash is known
+        self._manifest: Optional[dict] = None
+        self._manifest_entries: Dict[str, list] = {}
+        
     def _setup_logging(self) -> logging.Logger:
         logger = logging.getLogger('mcp_package')
         logger.setLevel(logging.INFO)
@@ -76,19 +365,20 @@ class PackageBuilder:
             # Create package directory
             self.package_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy binaries and dependencies
-            self._copy_binaries()
-            
-            # Copy configuration files
-            self._copy_configs()
-            
-            # Copy documentation
-            self._copy_documentation()
+            # Copy binaries, configuration files and documentation, and create
+            # installation scripts. Each phase fills its own subdirectory, so
+            # they run concurrently.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                phases = [
+                    executor.submit(self._copy_binaries),
+                    executor.submit(self._copy_configs),
+                    executor.submit(self._copy_documentation),
+                    executor.submit(self._create_install_scripts),
+                ]
+                for phase in phases:
+                    phase.result()
             
-            # Create installation scripts
-            self._create_install_scripts()
-            
-            # Create plugin package
+            # Create plugin package (from the plugin copied with the binaries)
             self._create_plugin_package()
             
             # Create manifests
@@ -107,6 +397,27 @@ class PackageBuilder:
             self.logger.error(f"Package creation failed: {e}")
             return False
     
+    def _fast_copy(self, src: Path, dst: Path):
+        """Copy a file with its metadata, letting the OS move the bytes"""
+        if os.path.isdir(dst):
+            dst = Path(dst) / Path(src).name
+        
+        # On Windows CopyFileW copies data, attributes and timestamps in the
+        # kernel. Elsewhere shutil.copy2 already uses sendfile/fcopyfile.
+        if os.name == 'nt':
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+                return dst
+        
+        return shutil.copy2(src, dst)
+    
+    def _copy_batch(self, copies: List[Tuple[Path, Path]]):
+        """Copy many small files at once instead of one after another"""
+        # The copy syscalls release the GIL, so the copies overlap in the kernel
+        with ThreadPoolExecutor(max_workers=min(8, len(copies) or 1)) as executor:
+            # Consume the results so a failed copy raises here
+            list(executor.map(lambda pair: self._fast_copy(*pair), copies))
+    
     def _copy_binaries(self):
         """Copy main executables and dependencies"""
         self.logger.info("Copying binaries...")
@@ -117,7 +428,7 @@ class PackageBuilder:
         # Main executable
         exe_path = self.build_dir / "src" / "cli" / self.config / "mcp-debugger.exe"
         if exe_path.exists():
-            shutil.copy2(exe_path, bin_dir)
+            self._fast_copy(exe_path, bin_dir)
             self.logger.info(f"Copied: {exe_path.name}")
         else:
             raise FileNotFoundError(f"Main executable not found: {exe_path}")
@@ -129,11 +440,11 @@ class PackageBuilder:
         plugin_dir = self.package_dir / "plugins"
         plugin_dir.mkdir(exist_ok=True)
         
-        plugin_suffix = "dp64" if self.platform == "x64" else "dp32"
+        plugin_suffix = PLUGIN_SUFFIXES[self.platform]
         plugin_path = self.build_dir / "src" / "x64dbg" / self.config / f"mcp_debugger.{plugin_suffix}"
         
         if plugin_path.exists():
-            shutil.copy2(plugin_path, plugin_dir)
+            self._fast_copy(plugin_path, plugin_dir)
             self.logger.info(f"Copied plugin: {plugin_path.name}")
     
     def _copy_runtime_dependencies(self, bin_dir: Path):
@@ -147,18 +458,31 @@ class PackageBuilder:
             # "openssl.dll",
         ]
         
+        # Search common locations for dependencies
+        search_paths = [
+            self.build_dir / "src" / "cli" / self.config,
+            Path("C:/Windows/System32"),
+            # Add vcpkg or other dependency paths
+        ]
+        
+        # List each search path at most once instead of probing it per DLL.
+        # Names are compared case-insensitively, as Windows does.
+        listings: Dict[Path, Dict[str, str]] = {}
+        
         for dll in dependencies:
-            # Search common locations for dependencies
-            search_paths = [
-                self.build_dir / "src" / "cli" / self.config,
-                Path("C:/Windows/System32"),
-                # Add vcpkg or other dependency paths
-            ]
-            
             for search_path in search_paths:
-                dll_path = search_path / dll
-                if dll_path.exists():
-                    shutil.copy2(dll_path, bin_dir)
+                if search_path not in listings:
+                    try:
+                        with os.scandir(search_path) as it:
+                            listings[search_path] = {
+                                e.name.lower(): e.path for e in it if e.is_file()
+                            }
+                    except OSError:
+                        listings[search_path] = {}
+                
+                dll_path = listings[search_path].get(dll.lower())
+                if dll_path:
+                    self._fast_copy(dll_path, bin_dir)
                     self.logger.info(f"Copied dependency: {dll}")
                     break
     
@@ -172,40 +496,11 @@ class PackageBuilder:
         # Sample configuration
         sample_config = self.project_root / "sample-config.json"
         if sample_config.exists():
-            shutil.copy2(sample_config, config_dir / "config.json")
+            self._fast_copy(sample_config, config_dir / "config.json")
         
         # Create default configuration if sample doesn't exist
         else:
-            default_config = {
-                "api_configs": {
-                    "claude": {
-                        "model": "claude-3-sonnet-20240229",
-                        "endpoint": "https://api.anthropic.com/v1/messages",
-                        "timeout_ms": 30000,
-                        "max_retries": 3,
-                        "validate_ssl": True
-                    }
-                },
-                "debug_config": {
-                    "x64dbg_path": "C:\\x64dbg\\release\\x64\\x64dbg.exe",
-                    "auto_connect": False,
-                    "connection_timeout_ms": 5000
-                },
-                "log_config": {
-                    "level": 1,
-                    "output_path": "mcp-debugger.log",
-                    "console_output": True,
-                    "file_output": True
-                },
-                "security_config": {
-                    "credential_store_path": "credentials.encrypted",
-                    "require_api_key_validation": True,
-                    "encrypt_credentials": True
-                }
-            }
-            
-            with open(config_dir / "config.json", 'w') as f:
-                json.dump(default_config, f, indent=2)
+            (config_dir / "config.json").write_bytes(_default_config_bytes())
     
     def _copy_documentation(self):
         """Copy documentation files"""
@@ -222,10 +517,11 @@ class PackageBuilder:
             ("LICENSE", "LICENSE"),
         ]
         
+        copies = []
         for src_name, dst_name in doc_files:
             src_path = self.project_root / src_name
             if src_path.exists():
-                shutil.copy2(src_path, docs_dir / dst_name)
+                copies.append((src_path, docs_dir / dst_name))
             else:
                 self.logger.warning(f"Documentation file not found: {src_name}")
         
@@ -238,119 +534,30 @@ class PackageBuilder:
         for demo_file in demo_files:
             demo_path = scripts_src / demo_file
             if demo_path.exists():
-                shutil.copy2(demo_path, scripts_dst)
+                copies.append((demo_path, scripts_dst / demo_file))
+        
+        self._copy_batch(copies)
     
     def _create_install_scripts(self):
         """Create installation and setup scripts"""
         self.logger.info("Creating installation scripts...")
         
         # Windows batch installer
-        install_script = f"""@echo off
-REM MCP Debugger Installation Script
-echo Installing MCP Debugger {PACKAGE_CONFIG['version']}...
-
-REM Create installation directory
-set INSTALL_DIR=%ProgramFiles%\\MCPDebugger
-if not exist "%INSTALL_DIR%" mkdir "%INSTALL_DIR%"
-
-REM Copy files
-echo Copying files...
-xcopy /E /I /Y bin "%INSTALL_DIR%\\bin\\"
-xcopy /E /I /Y config "%INSTALL_DIR%\\config\\"
-xcopy /E /I /Y docs "%INSTALL_DIR%\\docs\\"
-
-REM Add to PATH
-echo Adding to PATH...
-setx PATH "%PATH%;%INSTALL_DIR%\\bin" /M
-
-REM Install x64dbg plugin
-set PLUGIN_SRC=%~dp0plugins\\mcp_debugger.{plugin_suffix}
-echo.
-echo To install x64dbg plugin:
-echo 1. Copy %PLUGIN_SRC% to your x64dbg\\plugins\\ directory
-echo 2. Restart x64dbg
-echo.
-
-REM Create shortcuts
-echo Creating shortcuts...
-set DESKTOP=%USERPROFILE%\\Desktop
-powershell "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%DESKTOP%\\MCP Debugger.lnk'); $Shortcut.TargetPath = '%INSTALL_DIR%\\bin\\mcp-debugger.exe'; $Shortcut.Save()"
-
-echo.
-echo Installation complete!
-echo Run 'mcp-debugger --help' to get started.
-echo.
-pause
-"""
-        
-        plugin_suffix = "dp64" if self.platform == "x64" else "dp32"
-        install_script = install_script.format(plugin_suffix=plugin_suffix)
-        
-        with open(self.package_dir / "install.bat", 'w') as f:
-            f.write(install_script)
+        (self.package_dir / "install.bat").write_bytes(INSTALL_BAT[self.platform])
         
         # PowerShell installer (more advanced)
-        ps_script = f'''# MCP Debugger PowerShell Installer
-param(
-    [string]$InstallPath = "$env:ProgramFiles\\MCPDebugger",
-    [switch]$AddToPath = $true,
-    [switch]$CreateShortcuts = $true
-)
-
-Write-Host "Installing MCP Debugger {PACKAGE_CONFIG['version']}..." -ForegroundColor Cyan
-
-# Check if running as administrator
-if (-NOT ([Security.Principal.WindowsPrincipal] [Security.Principal.WindowsIdentity]::GetCurrent()).IsInRole([Security.Principal.WindowsBuiltInRole] "Administrator")) {{
-    Write-Host "Warning: Not running as Administrator. Some features may not work." -ForegroundColor Yellow
-}}
-
-# Create installation directory
-if (!(Test-Path $InstallPath)) {{
-    New-Item -Path $InstallPath -ItemType Directory -Force | Out-Null
-}}
-
-# Copy files
-Write-Host "Copying files to $InstallPath..." -ForegroundColor Green
-Copy-Item -Path "bin\\*" -Destination "$InstallPath\\bin\\" -Recurse -Force
-Copy-Item -Path "config\\*" -Destination "$InstallPath\\config\\" -Recurse -Force
-Copy-Item -Path "docs\\*" -Destination "$InstallPath\\docs\\" -Recurse -Force
-
-# Add to PATH
-if ($AddToPath) {{
-    Write-Host "Adding to system PATH..." -ForegroundColor Green
-    $currentPath = [Environment]::GetEnvironmentVariable("PATH", "Machine")
-    if ($currentPath -notlike "*$InstallPath\\bin*") {{
-        [Environment]::SetEnvironmentVariable("PATH", "$currentPath;$InstallPath\\bin", "Machine")
-    }}
-}}
-
-# Create shortcuts
-if ($CreateShortcuts) {{
-    Write-Host "Creating desktop shortcut..." -ForegroundColor Green
-    $WshShell = New-Object -comObject WScript.Shell
-    $Shortcut = $WshShell.CreateShortcut("$env:USERPROFILE\\Desktop\\MCP Debugger.lnk")
-    $Shortcut.TargetPath = "$InstallPath\\bin\\mcp-debugger.exe"
-    $Shortcut.WorkingDirectory = "$InstallPath\\bin"
-    $Shortcut.Save()
-}}
-
-Write-Host "Installation complete!" -ForegroundColor Green
-Write-Host "Run 'mcp-debugger --help' to get started." -ForegroundColor Cyan
-'''
-        
-        with open(self.package_dir / "install.ps1", 'w', encoding='utf-8') as f:
-            f.write(ps_script)
+        (self.package_dir / "install.ps1").write_bytes(INSTALL_PS1[self.platform])
     
     def _create_plugin_package(self):
         """Create separate x64dbg plugin package"""
         plugin_dir = self.package_dir / "x64dbg-plugin"
         plugin_dir.mkdir(exist_ok=True)
         
-        plugin_suffix = "dp64" if self.platform == "x64" else "dp32"
+        plugin_suffix = PLUGIN_SUFFIXES[self.platform]
         plugin_src = self.package_dir / "plugins" / f"mcp_debugger.{plugin_suffix}"
         
         if plugin_src.exists():
-            shutil.copy2(plugin_src, plugin_dir)
+            self._fast_copy(plugin_src, plugin_dir)
             
             # Create plugin README
             plugin_readme = f"""# MCP Debugger x64dbg Plugin
@@ -370,8 +577,7 @@ Use MCP commands directly in x64dbg command line:
 Edit the MCP configuration file in the x64dbg directory or use the standalone application to configure API keys.
 """
             
-            with open(plugin_dir / "README.md", 'w') as f:
-                f.write(plugin_readme)
+            (plugin_dir / "README.md").write_bytes(plugin_readme.encode("utf-8"))
     
     def _create_manifests(self):
         """Create package manifests and metadata"""
@@ -379,15 +585,17 @@ Edit the MCP configuration file in the x64dbg directory or use the standalone ap
         
         # Package manifest
         manifest = {
-            "name": PACKAGE_CONFIG["name"],
-            "version": PACKAGE_CONFIG["version"],
+            "manifest_schema": 2,
+            "name": PACKAGE_NAME,
+            "version": PACKAGE_VERSION,
             "platform": self.platform,
             "config": self.config,
             "description": PACKAGE_CONFIG["description"],
             "author": PACKAGE_CONFIG["author"],
             "license": PACKAGE_CONFIG["license"],
             "created": str(Path().absolute()),
-            "files": [],
+            "dirs": [],  # each directory path once
+            "files": [],  # [index into dirs, file name, size, sha256]
             "dependencies": {
                 "visual_cpp_redist": "2019+",
                 "windows": "10+",
@@ -396,21 +604,27 @@ Edit the MCP configuration file in the x64dbg directory or use the standalone ap
         }
         
         # Enumerate all package files
-        for root, dirs, files in os.walk(self.package_dir):
-            for file in files:
-                file_path = Path(root) / file
-                rel_path = file_path.relative_to(self.package_dir)
-                manifest["files"].append({
-                    "path": str(rel_path),
-                    "size": file_path.stat().st_size
-                })
-        
-        with open(self.package_dir / "manifest.json", 'w') as f:
-            json.dump(manifest, f, indent=2)
+        dir_index: Dict[str, int] = {}
+        files = sorted(
+            (f for f in self._enumerate_files(str(self.package_dir))
+             if f[1] not in GENERATED_FILES),
+            key=lambda f: f[1]
+        )
+        for _, rel_path, size in files:
+            rel_dir, _, name = rel_path.rpartition("/")
+            if rel_dir not in dir_index:
+                dir_index[rel_dir] = len(manifest["dirs"])
+                manifest["dirs"].append(rel_dir)
+            entry = [dir_index[rel_dir], name, size]
+            manifest["files"].append(entry)
+            self._manifest_entries[rel_path] = entry
+        
+        # manifest.json itself is written while archiving, see _create_zip_archive
+        self._manifest = manifest
         
         # Version info
         version_info = {
-            "version": PACKAGE_CONFIG["version"],
+            "version": PACKAGE_VERSION,
             "build_date": str(Path().absolute()),
             "platform": self.platform,
             "config": self.config,
@@ -422,37 +636,36 @@ Edit the MCP configuration file in the x64dbg directory or use the standalone ap
             }
         }
         
-        with open(self.package_dir / "version.json", 'w') as f:
-            json.dump(version_info, f, indent=2)
+        version_path = self.package_dir / "version.json"
+        files.append((str(version_path), "version.json", _write_json(version_path, version_info)))
+        
+        # The archive reuses this listing instead of walking the tree again
+        files.sort(key=lambda f: f[1])
+        self._enumerated_files = files
+    
+    def _enumerate_files(self, root: str):
+        """Yield (path, relative posix path, size) for every file below root"""
+        prefix_len = len(os.path.join(root, ""))
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # DirEntry caches its stat result
+                        rel_path = entry.path[prefix_len:]
+                        if os.sep != "/":
+                            rel_path = rel_path.replace(os.sep, "/")
+                        yield entry.path, rel_path, entry.stat().st_size
     
     def _get_git_hash(self) -> str:
         """Get current git commit hash"""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-        return "unknown"
+        return _git_hash(str(self.project_root))
     
     def _get_cmake_version(self) -> str:
         """Get CMake version"""
-        try:
-            result = subprocess.run(
-                ["cmake", "--version"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return result.stdout.split('\\n')[0]
-        except:
-            pass
-        return "unknown"
+        return _cmake_version()
     
     def _create_zip_archive(self) -> Path:
         """Create ZIP archive of the package"""
@@ -460,16 +673,71 @@ Edit the MCP configuration file in the x64dbg directory or use the standalone ap
         
         zip_path = self.output_dir / f"{self.package_name}.zip"
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(self.package_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_name = file_path.relative_to(self.package_dir)
-                    zipf.write(file_path, arc_name)
+        files = self._enumerated_files
+        if files is None:  # manifests were not created in this run
+            files = sorted(self._enumerate_files(str(self.package_dir)), key=lambda f: f[1])
+        if self._manifest is not None:
+            # The fresh manifest is appended below; never archive a stale copy
+            files[:] = [f for f in files if f[1] != "manifest.json"]
+        
+        # Small packages are assembled in memory and written out with a single
+        # write, sparing the seek-back header patching zipfile does per member
+        in_memory = sum(size for _, _, size in files) <= ZIP_IN_MEMORY_LIMIT
+        target = io.BytesIO() if in_memory else zip_path
+        
+        with _zip_crc32(), zipfile.ZipFile(target, 'w', self.compression,
+                                           compresslevel=self.compress_level,
+                                           allowZip64=True) as zipf:
+            for file_path, arc_name, size in files:
+                digest = self._write_zip_member(zipf, file_path, arc_name, size)
+                entry = self._manifest_entries.get(arc_name)
+                if entry is not None:
+                    entry.append(digest)
+            
+            if self._manifest is not None:
+                # Every member hash is known now, so the manifest goes in last
+                manifest_path = self.package_dir / "manifest.json"
+                size = _write_json(manifest_path, self._manifest)
+                self._write_zip_member(zipf, str(manifest_path), "manifest.json", size)
+                files.append((str(manifest_path), "manifest.json", size))
+        
+        if in_memory:
+            # A buffered file loops over short writes until all of it is out
+            with open(zip_path, 'wb') as f, target.getbuffer() as data:
+                f.write(data)
         
         self.logger.info(f"Archive created: {zip_path} ({zip_path.stat().st_size // 1024} KB)")
         return zip_path
     
+    def _write_zip_member(self, zipf: zipfile.ZipFile, file_path: str, arc_name: str,
+                          size: int) -> str:
+        """Add one file to the archive with fixed metadata, returning its SHA-256"""
+        # A fixed timestamp and mode keep archives of identical trees
+        # byte-identical and spare zipfile a stat per member
+        zinfo = zipfile.ZipInfo(arc_name, date_time=ZIP_TIMESTAMP)
+        zinfo.external_attr = 0o644 << 16
+        zinfo.file_size = size  # lets zipfile decide on ZIP64 up front
+        if size < STORE_BELOW_BYTES or arc_name.lower().endswith(PRECOMPRESSED_SUFFIXES):
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = self.compression
+            zinfo._compresslevel = self.compress_level  # no public setter before 3.13
+        
+        # The file is hashed on the same pass that feeds the archive
+        with open(file_path, 'rb', buffering=0) as src, zipf.open(zinfo, 'w') as dest:
+            if size >= ZIP_MMAP_THRESHOLD:
+                # Hand the whole mapping to crc32/deflate in one call rather
+                # than copying it through Python in buffer-sized chunks
+                with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest = hashlib.sha256(mapped)
+                    dest.write(mapped)
+            else:
+                reader = HashingReader(src)
+                shutil.copyfileobj(reader, dest, ZIP_COPY_BUFFER)
+                digest = reader.digest
+        
+        return digest.hexdigest()
+    
     def _verify_package(self):
         """Verify package completeness"""
         self.logger.info("Verifying package...")
@@ -484,18 +752,21 @@ Edit the MCP configuration file in the x64dbg directory or use the standalone ap
             "install.ps1"
         ]
         
-        missing_files = []
-        for req_file in required_files:
-            file_path = self.package_dir / req_file
-            if not file_path.exists():
-                missing_files.append(req_file)
+        if self._enumerated_files is not None:
+            # Everything in the package was listed when the manifest was built
+            packaged = {rel_path for _, rel_path, _ in self._enumerated_files}
+            missing_files = [f for f in required_files if f not in packaged]
+        else:
+            missing_files = [
+                f for f in required_files if not (self.package_dir / f).exists()
+            ]
         
         if missing_files:
             self.logger.warning(f"Missing files: {missing_files}")
         else:
             self.logger.info("Package verification passed")
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description='MCP Debugger Package Creator')
     parser.add_argument('--platform', choices=['x64', 'x86'], default='x64',
                         help='Target platform')
@@ -503,13 +774,17 @@ def main():
                         help='Build configuration')
     parser.add_argument('--output', required=True,
                         help='Output directory for packages')
+    parser.add_argument('--compression', type=parse_compression, default='deflate:6',
+                        help='Archive compression: stored, deflate or deflate:<0-9> '
+                             '(stored is fastest, for CI-internal packages)')
     parser.add_argument('--verbose', action='store_true',
                         help='Verbose output')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Create package builder
-    builder = PackageBuilder(args.platform, args.config, args.output)
+    builder = PackageBuilder(args.platform, args.config, args.output,
+                             compression=args.compression)
     
     if args.verbose:
         builder.logger.setLevel(logging.DEBUG)
@@ -18,97 +18,299 @@ import time
 import psutil
 import subprocess
 import threading
+import math
 import statistics
 import argparse
+import importlib.util
 import json
 import tempfile
+import shutil
+import queue
+import asyncio
+from array import array
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Optional
+from dataclasses import dataclass, asdict
 import logging
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
+
+NS_PER_SEC = 1_000_000_000
+
+# subprocess only takes the posix_spawn fast path instead of fork+exec when
+# close_fds is off (among other conditions). Leaving descriptors open is safe
+# since Python creates them non-inheritable; Windows keeps the default.
+SPAWN_OPTIONS = {'close_fds': False} if os.name == 'posix' else {}
+
+# Native probe that times startups without Python's Popen overhead (Linux only)
+STARTUP_BENCH_SOURCE = Path(__file__).resolve().parent / "startup_bench.c"
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     test_name: str
-    duration: float
+    duration_ns: int
     memory_peak: int  # bytes
     memory_average: int  # bytes
     cpu_peak: float  # percentage
     cpu_average: float  # percentage
     operations_per_second: float
     success_rate: float
+    # Per-operation latency percentiles, where the test times single operations
+    latency_min_ns: int = 0
+    latency_p50_ns: int = 0
+    latency_p95_ns: int = 0
+    latency_p99_ns: int = 0
+    
+    @property
+    def duration(self) -> float:
+        """Duration in seconds"""
+        return self.duration_ns / NS_PER_SEC
+
+def latency_percentiles(times_ns: Sequence[int]) -> Dict[str, int]:
+    """Min and p50/p95/p99 of per-operation times (nearest rank), as PerformanceMetrics fields"""
+    ordered = sorted(times_ns)
+    percentiles = {
+        f'latency_p{q}_ns': ordered[max(math.ceil(q * len(ordered) / 100) - 1, 0)]
+        for q in (50, 95, 99)
+    }
+    percentiles['latency_min_ns'] = ordered[0]
+    return percentiles
 
 class PerformanceMonitor:
-    def __init__(self, process_name: str = "mcp-debugger.exe"):
+    PROCESS_LOOKUP_TIMEOUT = 2.0  # seconds to wait for a process by name
+    
+    def __init__(self, process_name: str = "mcp-debugger.exe", interval: float = 0.1):
         self.process_name = process_name
-        self.monitoring = False
-        self.metrics = []
+        self.interval = interval  # seconds between samples
+        # Set to stop sampling; waiting on it lets stop_monitoring wake the
+        # thread immediately instead of after its current sleep
+        self._stop = threading.Event()
+        self.monitor_thread: Optional[threading.Thread] = None
+        self._reset_samples()
         self.start_time = 0
+        self._resolved_pid: Optional[int] = None
+        self._process: Optional[psutil.Process] = None
+        self._cpu_start: Tuple[int, int] = (0, 0)  # (CPU time ns, timestamp ns)
+    
+    def _reset_samples(self):
+        # One typed int64 column per metric rather than a dict per sample;
+        # CPU is the cumulative user + system time in ns
+        self.timestamps = array('q')
+        self.memory_rss = array('q')
+        self.memory_vms = array('q')
+        self.cpu_time_ns = array('q')
+    
+    @staticmethod
+    def _process_cpu_ns(process: psutil.Process) -> int:
+        cpu_times = process.cpu_times()
+        return int((cpu_times.user + cpu_times.system) * NS_PER_SEC)
         
     def start_monitoring(self, pid: Optional[int] = None):
         """Start monitoring system resources"""
-        self.monitoring = True
-        self.start_time = time.time()
-        self.metrics = []
+        self._stop.clear()
+        self.start_time = time.perf_counter_ns()
+        self._reset_samples()
+        
+        # Resolve the process once up front; scanning the whole process
+        # table by name on every sample costs more than the sample itself
+        self._resolved_pid = pid if pid else self._wait_for_process()
+        if self._resolved_pid is None:
+            return
+        
+        try:
+            process = psutil.Process(self._resolved_pid)
+            self._cpu_start = (self._process_cpu_ns(process),
+                               time.perf_counter_ns() - self.start_time)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+        self._process = process
         
         def monitor_loop():
-            while self.monitoring:
+            while not self._stop.is_set():
                 try:
-                    if pid:
-                        process = psutil.Process(pid)
-                    else:
-                        # Find process by name
-                        processes = [p for p in psutil.process_iter(['pid', 'name']) 
-                                   if self.process_name in p.info['name']]
-                        if not processes:
-                            time.sleep(0.1)
-                            continue
-                        process = psutil.Process(processes[0].info['pid'])
-                    
-                    # Collect metrics
-                    memory_info = process.memory_info()
-                    cpu_percent = process.cpu_percent()
+                    # Collect metrics from a single /proc read. CPU time comes
+                    # from the same stat record status() already parsed.
+                    with process.oneshot():
+                        if process.status() == psutil.STATUS_ZOMBIE:
+                            break  # Exited but not yet reaped
+                        memory_info = process.memory_info()
+                        cpu_ns = self._process_cpu_ns(process)
                     
-                    metric = {
-                        'timestamp': time.time() - self.start_time,
-                        'memory_rss': memory_info.rss,
-                        'memory_vms': memory_info.vms,
-                        'cpu_percent': cpu_percent,
-                    }
+                    self.timestamps.append(time.perf_counter_ns() - self.start_time)
+                    self.memory_vms.append(memory_info.vms)
+                    self.cpu_time_ns.append(cpu_ns)
+                    self.memory_rss.append(memory_info.rss)
                     
-                    self.metrics.append(metric)
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                except psutil.NoSuchProcess:
+                    break
+                except psutil.AccessDenied:
                     pass
                 
-                time.sleep(0.1)  # Sample every 100ms
+                self._stop.wait(self.interval)
         
         self.monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitor_thread.start()
     
+    def _wait_for_process(self) -> Optional[int]:
+        """Wait briefly for a process matching the monitored name to appear"""
+        deadline = time.monotonic() + self.PROCESS_LOOKUP_TIMEOUT
+        while True:
+            process = self._find_process()
+            if process is not None:
+                return process.pid
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.interval)
+    
+    def _find_process(self) -> Optional[psutil.Process]:
+        """Find the first running process matching the monitored name"""
+        for p in psutil.process_iter(['pid', 'name']):
+            if self.process_name in (p.info['name'] or ''):
+                return p
+        return None
+    
     def stop_monitoring(self) -> Dict:
         """Stop monitoring and return aggregated metrics"""
-        self.monitoring = False
+        self._stop.set()
+        if self.monitor_thread is not None:
+            self.monitor_thread.join()
+            self.monitor_thread = None
         
-        if not self.metrics:
+        memory_rss = self.memory_rss
+        if not memory_rss:
             return {}
         
-        memory_rss = [m['memory_rss'] for m in self.metrics]
-        cpu_values = [m['cpu_percent'] for m in self.metrics if m['cpu_percent'] > 0]
+        # CPU usage is derived from cumulative CPU time: the average from the
+        # run's end points, the peak from the busiest interval between samples.
+        # This also counts short-lived processes that a per-sample
+        # cpu_percent() reading (0.0 on its first call) would miss.
+        try:
+            cpu_end = (self._process_cpu_ns(self._process),
+                       time.perf_counter_ns() - self.start_time)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            cpu_end = (self.cpu_time_ns[-1], self.timestamps[-1])
+        
+        cpu_peak = 0.0
+        prev_cpu, prev_ts = self._cpu_start
+        for cpu_ns, ts in zip(self.cpu_time_ns, self.timestamps):
+            if ts > prev_ts:
+                cpu_peak = max(cpu_peak, (cpu_ns - prev_cpu) / (ts - prev_ts))
+                prev_cpu, prev_ts = cpu_ns, ts
+        
+        wall_ns = cpu_end[1] - self._cpu_start[1]
+        cpu_average = (cpu_end[0] - self._cpu_start[0]) / wall_ns if wall_ns > 0 else 0
         
         return {
-            'duration': time.time() - self.start_time,
-            'memory_peak': max(memory_rss) if memory_rss else 0,
-            'memory_average': statistics.mean(memory_rss) if memory_rss else 0,
-            'cpu_peak': max(cpu_values) if cpu_values else 0,
-            'cpu_average': statistics.mean(cpu_values) if cpu_values else 0,
-            'sample_count': len(self.metrics)
+            'duration_ns': time.perf_counter_ns() - self.start_time,
+            'memory_peak': max(memory_rss),
+            'memory_average': sum(memory_rss) / len(memory_rss),
+            'cpu_peak': 100 * cpu_peak,
+            'cpu_average': 100 * cpu_average,
+            'sample_count': len(memory_rss)
         }
 
+class PersistentREPL:
+    """Long-lived interactive session evaluating one expression per line
+    
+    Started without a command the binary runs its REPL, which prints a prompt
+    once it is ready for the next line; everything it writes before that
+    prompt is the response to the previous line.
+    """
+    
+    PROMPT_SUFFIX = b"> "
+    
+    def __init__(self, binary_path: str, timeout: float = 10):
+        self.timeout = timeout
+        self.proc = subprocess.Popen(
+            [binary_path, "-q"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            **SPAWN_OPTIONS
+        )
+        
+        # Pipes cannot be polled with a timeout on Windows, so a reader thread
+        # feeds stdout through a queue instead
+        self._output: queue.Queue = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+        
+        try:
+            self._read_response(self.timeout)  # Initial prompt
+        except Exception:
+            self.close()
+            raise
+    
+    def _read_output(self):
+        fd = self.proc.stdout.fileno()
+        for chunk in iter(lambda: os.read(fd, 65536), b''):
+            self._output.put(chunk)
+        self._output.put(None)
+    
+    def _read_response(self, timeout: float) -> bytes:
+        """Read output up to the next prompt"""
+        deadline = time.monotonic() + timeout
+        data = b''
+        
+        while not data.endswith(self.PROMPT_SUFFIX):
+            try:
+                chunk = self._output.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise TimeoutError(f"No REPL prompt within {timeout}s")
+            if chunk is None:
+                raise RuntimeError("REPL exited unexpectedly")
+            data += chunk
+        
+        # Drop the prompt line itself
+        return data[:data.rfind(b'\n') + 1]
+    
+    def eval(self, expr: str, timeout: Optional[float] = None) -> bool:
+        """Evaluate one expression, returning whether it succeeded"""
+        self.proc.stdin.write(expr.encode() + b'\n')
+        response = self._read_response(timeout or self.timeout)
+        return not any(line.startswith(b'Error: ') for line in response.splitlines())
+    
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(b':quit\n')
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+        self.proc.stdin.close()
+        # The reader sees EOF once the child has exited; closing stdout under
+        # it could hand its descriptor number to an unrelated file
+        self._reader.join(timeout=5)
+        self.proc.stdout.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 class PerformanceTester:
-    def __init__(self, binary_path: str, iterations: int = 100):
+    STARTUP_WARMUP_RUNS = 2  # discarded launches before startup timing
+    STARTUP_MEASURED_RUNS = 10
+    LEAK_MIN_ITERATIONS = 500  # floor under --iterations for the leak test
+    LEAK_SAMPLES = 24  # RSS samples spread over the leak test
+    LEAK_WARMUP_FRACTION = 0.25  # leading share of samples left out of the fit
+    LEAK_WINDOWS = 3  # RSS must keep growing in every one of these
+    LEAK_SLOPE_THRESHOLD = 64  # bytes of RSS growth per iteration
+    
+    def __init__(self, binary_path: str, iterations: int = 100, parallel: bool = False):
         self.binary_path = Path(binary_path)
+        self.binary_str = str(self.binary_path)
         self.iterations = iterations
+        # Sessions used by tests that may spread their expressions out
+        self.workers = (os.cpu_count() or 1) if parallel else 1
         self.logger = self._setup_logging()
         self.results: List[PerformanceMetrics] = []
         
@@ -126,6 +328,82 @@ class PerformanceTester:
         
         return logger
     
+    def _eval_many(self, exprs: List[str], timeout: float = 10,
+                   workers: int = 1) -> Tuple[List[int], int]:
+        """Evaluate expressions in one process, returning per-op times (ns) and successes
+        
+        Spawning the binary per expression would measure process startup rather
+        than evaluation, so all expressions go through a single REPL session.
+        If the REPL is unavailable they run as one script file instead, with the
+        script's total time spread evenly across its lines. With several workers
+        the expressions are split across that many sessions run side by side.
+        """
+        if workers > 1 and len(exprs) > 1:
+            shards = [exprs[i::workers] for i in range(min(workers, len(exprs)))]
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                shard_results = list(executor.map(
+                    lambda shard: self._eval_many(shard, timeout), shards))
+            
+            return ([t for shard_times, _ in shard_results for t in shard_times],
+                    sum(shard_successes for _, shard_successes in shard_results))
+        
+        times = []
+        successes = 0
+        
+        try:
+            repl = PersistentREPL(self.binary_str, timeout)
+        except Exception as e:
+            self.logger.warning(f"REPL unavailable ({e}), running expressions as a script")
+            return self._eval_script(exprs, timeout * len(exprs))
+        
+        with repl:
+            for expr in exprs:
+                expr_start = time.perf_counter_ns()
+                ok = repl.eval(expr)
+                times.append(time.perf_counter_ns() - expr_start)
+                
+                if ok:
+                    successes += 1
+        
+        return times, successes
+    
+    def _run_binary(self, args: List[str], timeout: float = 10,
+                    capture_stderr: bool = False) -> Tuple[subprocess.CompletedProcess, int]:
+        """Run the binary once with output discarded, returning the result and elapsed ns
+        
+        Stdout is never read by the tests, so it always goes to DEVNULL; stderr
+        is only piped back when the caller needs to inspect it.
+        """
+        start_time = time.perf_counter_ns()
+        proc = subprocess.run(
+            [self.binary_str, *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+            text=True,
+            timeout=timeout,
+            **SPAWN_OPTIONS
+        )
+        return proc, time.perf_counter_ns() - start_time
+    
+    def _eval_script(self, exprs: List[str], timeout: float) -> Tuple[List[int], int]:
+        """Run expressions as a single script file"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.mcp', delete=False) as f:
+            f.write("\n".join(exprs) + "\n")
+            script_path = f.name
+        
+        try:
+            proc, total_ns = self._run_binary(["-q", "-f", script_path], timeout,
+                                              capture_stderr=True)
+        finally:
+            os.unlink(script_path)
+        
+        # Each failing line is reported as "Error: Line N: ..."
+        errors = sum(1 for line in proc.stderr.splitlines() if ": Line " in line)
+        if proc.returncode != 0 and not errors:
+            errors = len(exprs)
+        
+        return [total_ns // len(exprs)] * len(exprs), len(exprs) - errors
+    
     def run_all_tests(self) -> bool:
         """Run all performance tests"""
         self.logger.info("Starting MCP Debugger Performance Tests")
@@ -163,27 +441,107 @@ class PerformanceTester:
     
     def test_startup_time(self) -> Optional[PerformanceMetrics]:
         """Test application startup time"""
+        runs = min(self.STARTUP_MEASURED_RUNS, self.iterations)  # Limit startup tests
+        
+        # The first launches pay for cold disk caches and, on Windows, on-access
+        # scanning of a new executable; keep them out of the measurement
+        for i in range(self.STARTUP_WARMUP_RUNS):
+            self._run_binary(["--help"], timeout=30)
+        
+        with tempfile.TemporaryDirectory() as build_dir:
+            bench = self._build_startup_bench(build_dir)
+            if bench:
+                startup_times, memory_peaks = self._measure_startup_native(bench, runs)
+            else:
+                startup_times, memory_peaks = self._measure_startup(runs)
+        
+        if not startup_times:
+            return None
+        
+        # Startup times are heavy-tailed, so report the median rather than the mean
+        percentiles = latency_percentiles(startup_times)
+        median_startup = percentiles['latency_p50_ns']
+        
+        return PerformanceMetrics(
+            test_name="Startup Time",
+            duration_ns=median_startup,
+            memory_peak=max(memory_peaks),
+            memory_average=sum(memory_peaks) / len(memory_peaks),
+            cpu_peak=0,  # Not measured for startup
+            cpu_average=0,
+            operations_per_second=NS_PER_SEC / median_startup,
+            success_rate=len(startup_times) / runs,
+            **percentiles
+        )
+    
+    def _build_startup_bench(self, build_dir: str) -> Optional[str]:
+        """Compile the native startup probe, or return None where it cannot be used"""
+        if not sys.platform.startswith('linux') or not STARTUP_BENCH_SOURCE.exists():
+            return None
+        
+        cc = shutil.which('cc')
+        if cc is None:
+            return None
+        
+        bench = os.path.join(build_dir, 'startup_bench')
+        proc = subprocess.run(
+            [cc, '-O2', '-o', bench, str(STARTUP_BENCH_SOURCE)],
+            capture_output=True,
+            text=True
+        )
+        if proc.returncode != 0:
+            self.logger.warning(f"Could not build startup probe: {proc.stderr.strip()}")
+            return None
+        
+        return bench
+    
+    def _measure_startup_native(self, bench: str, runs: int) -> Tuple[List[int], List[int]]:
+        """Time startups from the native probe, returning successful times (ns) and peak RSS"""
+        proc = subprocess.run(
+            [bench, self.binary_str, str(runs), "--help"],
+            capture_output=True,
+            text=True,
+            timeout=30 * runs,
+            **SPAWN_OPTIONS
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Startup probe failed: {proc.stderr.strip()}")
+        
+        startup_times = []
+        memory_peaks = []
+        for line in proc.stdout.splitlines():
+            elapsed_ns, exit_status, max_rss_kb = map(int, line.split())
+            if exit_status == 0:
+                startup_times.append(elapsed_ns)
+                memory_peaks.append(max_rss_kb * 1024)
+        
+        return startup_times, memory_peaks
+    
+    def _measure_startup(self, runs: int) -> Tuple[List[int], List[int]]:
+        """Time startups from Python, returning successful times (ns) and peak RSS"""
         startup_times = []
         memory_peaks = []
+        argv = [self.binary_str, "--help"]
         
-        for i in range(min(10, self.iterations)):  # Limit startup tests
+        for i in range(runs):
             monitor = PerformanceMonitor()
             
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             
             # Start process
             proc = subprocess.Popen(
-                [str(self.binary_path), "--help"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **SPAWN_OPTIONS
             )
             
             monitor.start_monitoring(proc.pid)
             
             # Wait for completion
-            stdout, stderr = proc.communicate(timeout=30)
+            proc.wait(timeout=30)
             
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
             metrics = monitor.stop_monitoring()
             
             if proc.returncode == 0:
@@ -191,19 +549,7 @@ class PerformanceTester:
                 startup_times.append(startup_time)
                 memory_peaks.append(metrics.get('memory_peak', 0))
         
-        if not startup_times:
-            return None
-        
-        return PerformanceMetrics(
-            test_name="Startup Time",
-            duration=statistics.mean(startup_times),
-            memory_peak=max(memory_peaks),
-            memory_average=statistics.mean(memory_peaks),
-            cpu_peak=0,  # Not measured for startup
-            cpu_average=0,
-            operations_per_second=1.0 / statistics.mean(startup_times),
-            success_rate=len(startup_times) / min(10, self.iterations)
-        )
+        return startup_times, memory_peaks
     
     def test_sexpr_performance(self) -> Optional[PerformanceMetrics]:
         """Test S-Expression parsing performance"""
@@ -215,43 +561,26 @@ class PerformanceTester:
             "(log \"info\" \"performance test message\")",
         ]
         
-        times = []
-        successes = 0
-        monitor = PerformanceMonitor()
-        
-        start_time = time.time()
-        
-        for expr in expressions:
-            for i in range(self.iterations // len(expressions)):
-                expr_start = time.time()
-                
-                proc = subprocess.run(
-                    [str(self.binary_path), "-c", expr],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                expr_time = time.time() - expr_start
-                times.append(expr_time)
-                
-                if proc.returncode == 0:
-                    successes += 1
+        exprs = [expr for expr in expressions
+                 for i in range(self.iterations // len(expressions))]
         
-        total_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        times, successes = self._eval_many(exprs, workers=self.workers)
+        total_ns = time.perf_counter_ns() - start_time
         
         if not times:
             return None
         
         return PerformanceMetrics(
             test_name="S-Expression Parsing",
-            duration=total_time,
+            duration_ns=total_ns,
             memory_peak=0,  # Hard to measure for short operations
             memory_average=0,
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=len(times) / total_time,
-            success_rate=successes / len(times)
+            operations_per_second=len(times) * NS_PER_SEC / total_ns,
+            success_rate=successes / len(times),
+            **latency_percentiles(times)
         )
     
     def test_command_performance(self) -> Optional[PerformanceMetrics]:
@@ -263,42 +592,26 @@ class PerformanceTester:
             "(log \"debug\" \"test\")",
         ]
         
-        times = []
-        successes = 0
-        
-        start_time = time.time()
-        
-        for cmd in commands:
-            for i in range(self.iterations // len(commands)):
-                cmd_start = time.time()
-                
-                proc = subprocess.run(
-                    [str(self.binary_path), "-c", cmd],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                cmd_time = time.time() - cmd_start
-                times.append(cmd_time)
-                
-                if proc.returncode == 0:
-                    successes += 1
+        exprs = [cmd for cmd in commands
+                 for i in range(self.iterations // len(commands))]
         
-        total_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        times, successes = self._eval_many(exprs)
+        total_ns = time.perf_counter_ns() - start_time
         
         if not times:
             return None
         
         return PerformanceMetrics(
             test_name="Command Processing",
-            duration=total_time,
+            duration_ns=total_ns,
             memory_peak=0,
             memory_average=0,
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=len(times) / total_time,
-            success_rate=successes / len(times)
+            operations_per_second=len(times) * NS_PER_SEC / total_ns,
+            success_rate=successes / len(times),
+            **latency_percentiles(times)
         )
     
     def test_memory_stability(self) -> Optional[PerformanceMetrics]:
@@ -320,123 +633,173 @@ class PerformanceTester:
             script_path = f.name
         
         try:
-            start_time = time.time()
+            runs = min(20, self.iterations)
+            start_time = time.perf_counter_ns()
             
             # Run script multiple times to test memory stability
-            for i in range(min(20, self.iterations)):
-                proc = subprocess.run(
-                    [str(self.binary_path), "-f", script_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if proc.returncode != 0:
+            argv = [self.binary_str, "-f", script_path]
+            results = asyncio.run(self._run_batch([argv] * runs, timeout=30))
+            
+            for i, (returncode, _) in enumerate(results):
+                if returncode != 0:
                     self.logger.warning(f"Memory test iteration {i} failed")
             
-            total_time = time.time() - start_time
+            total_ns = time.perf_counter_ns() - start_time
             
             return PerformanceMetrics(
                 test_name="Memory Stability",
-                duration=total_time,
+                duration_ns=total_ns,
                 memory_peak=0,  # Would need process monitoring
                 memory_average=0,
                 cpu_peak=0,
                 cpu_average=0,
-                operations_per_second=min(20, self.iterations) / total_time,
-                success_rate=1.0  # Simplified
+                operations_per_second=runs * NS_PER_SEC / total_ns,
+                success_rate=sum(1 for returncode, _ in results if returncode == 0) / runs,
+                **latency_percentiles([elapsed_ns for _, elapsed_ns in results])
             )
             
         finally:
             os.unlink(script_path)
     
+    async def _run_batch(self, argv_list: List[List[str]], timeout: float) -> List[Tuple[int, int]]:
+        """Run independent invocations concurrently, returning (returncode, elapsed ns) for each"""
+        # Enough in flight to overlap one child's startup with another's work
+        # without oversubscribing the machine
+        limit = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+        
+        async def run_one(argv: List[str]) -> Tuple[int, int]:
+            async with limit:
+                start_time = time.perf_counter_ns()
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    **SPAWN_OPTIONS
+                )
+                try:
+                    returncode = await asyncio.wait_for(proc.wait(), timeout)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                return returncode, time.perf_counter_ns() - start_time
+        
+        return await asyncio.gather(*(run_one(argv) for argv in argv_list))
+    
     def test_concurrent_operations(self) -> Optional[PerformanceMetrics]:
         """Test concurrent operation handling"""
         num_threads = 4
         operations_per_thread = self.iterations // num_threads
         
-        results = []
-        start_time = time.time()
+        thread_exprs = [[f"(+ {thread_id} {i})" for i in range(operations_per_thread)]
+                        for thread_id in range(num_threads)]
         
-        def worker_thread(thread_id: int):
-            thread_results = []
-            for i in range(operations_per_thread):
-                op_start = time.time()
-                
-                proc = subprocess.run(
-                    [str(self.binary_path), "-c", f"(+ {thread_id} {i})"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                op_time = time.time() - op_start
-                thread_results.append({
-                    'time': op_time,
-                    'success': proc.returncode == 0
-                })
+        def worker_thread(repl: PersistentREPL, exprs: List[str]) -> Tuple[array, bytearray]:
+            # Each worker fills its own preallocated columns, merged after the
+            # pool finishes, so there is no shared state or per-op object
+            op_times = array('q', bytes(8 * len(exprs)))  # elapsed ns
+            op_success = bytearray(len(exprs))
             
-            results.extend(thread_results)
-        
-        # Start threads
-        threads = []
-        for i in range(num_threads):
-            thread = threading.Thread(target=worker_thread, args=(i,))
-            threads.append(thread)
-            thread.start()
+            for i, expr in enumerate(exprs):
+                op_start = time.perf_counter_ns()
+                op_success[i] = repl.eval(expr)
+                op_times[i] = time.perf_counter_ns() - op_start
+            
+            return op_times, op_success
         
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        with contextlib.ExitStack() as stack:
+            # One session per worker, started before timing begins. Threads are
+            # enough here since each one spends its time blocked on its pipe.
+            repl_pool = [stack.enter_context(PersistentREPL(self.binary_str))
+                         for _ in range(num_threads)]
+            
+            start_time = time.perf_counter_ns()
+            
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                # Consuming the results re-raises any worker failure
+                per_thread = list(executor.map(worker_thread, repl_pool, thread_exprs))
+            
+            total_ns = time.perf_counter_ns() - start_time
         
-        total_time = time.time() - start_time
+        times = array('q')
+        for op_times, _ in per_thread:
+            times.extend(op_times)
+        successes = b''.join(op_success for _, op_success in per_thread).count(1)
         
-        if not results:
+        if not times:
             return None
         
-        successes = sum(1 for r in results if r['success'])
-        
         return PerformanceMetrics(
             test_name="Concurrent Operations",
-            duration=total_time,
+            duration_ns=total_ns,
             memory_peak=0,
             memory_average=0,
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=len(results) / total_time,
-            success_rate=successes / len(results)
+            operations_per_second=len(times) * NS_PER_SEC / total_ns,
+            success_rate=successes / len(times),
+            **latency_percentiles(times)
         )
     
     def test_memory_leaks(self) -> Optional[PerformanceMetrics]:
         """Test for memory leaks during extended operation"""
-        # This is a simplified test - real memory leak detection
-        # would require tools like Application Verifier or similar
-        
-        iterations = min(50, self.iterations)
-        start_time = time.time()
-        
-        for i in range(iterations):
-            proc = subprocess.run(
-                [str(self.binary_path), "-c", "(list 1 2 3 4 5)"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if proc.returncode != 0:
-                self.logger.warning(f"Memory leak test iteration {i} failed")
+        # Repeats one expression in a single session and fits lines through
+        # the child's RSS; a steady upward slope means memory is not returned
+        iterations = max(self.iterations, self.LEAK_MIN_ITERATIONS)
+        sample_every = iterations // self.LEAK_SAMPLES
+        sample_iterations = []
+        sample_rss = []
+        successes = 0
         
-        total_time = time.time() - start_time
+        with PersistentREPL(self.binary_str) as repl:
+            child = psutil.Process(repl.proc.pid)
+            start_time = time.perf_counter_ns()
+            
+            for i in range(iterations):
+                if i % sample_every == 0:
+                    sample_iterations.append(i)
+                    sample_rss.append(child.memory_info().rss)
+                
+                if repl.eval("(list 1 2 3 4 5)"):
+                    successes += 1
+            
+            total_ns = time.perf_counter_ns() - start_time
+            sample_iterations.append(iterations)
+            sample_rss.append(child.memory_info().rss)
+        
+        if successes < iterations:
+            self.logger.warning(f"Memory leak test: {iterations - successes} iterations failed")
+        
+        # Allocators grow their heaps in steps, and a single step is not a
+        # leak. Past the warm-up, the remaining samples are split into windows
+        # and only growth that shows up in each of them counts.
+        samples = list(zip(sample_iterations, sample_rss))
+        samples = samples[int(len(samples) * self.LEAK_WARMUP_FRACTION):]
+        size = len(samples) // self.LEAK_WINDOWS
+        slopes = []
+        for w in range(self.LEAK_WINDOWS):
+            end = (w + 1) * size if w < self.LEAK_WINDOWS - 1 else len(samples)
+            xs, ys = zip(*samples[w * size:end])
+            slopes.append(statistics.linear_regression(xs, ys).slope)
+        
+        slope = min(slopes)
+        self.logger.info(f"  RSS growth: {slope:.1f} bytes/iteration "
+                         f"(slowest of {self.LEAK_WINDOWS} windows)")
+        
+        if slope > self.LEAK_SLOPE_THRESHOLD:
+            self.logger.error(f"Memory grows by {slope:.1f} bytes/iteration "
+                              f"(threshold {self.LEAK_SLOPE_THRESHOLD})")
+            return None
         
         return PerformanceMetrics(
             test_name="Memory Leak Detection",
-            duration=total_time,
-            memory_peak=0,  # Would need detailed monitoring
-            memory_average=0,
+            duration_ns=total_ns,
+            memory_peak=max(sample_rss),
+            memory_average=sum(sample_rss) / len(sample_rss),
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=iterations / total_time,
-            success_rate=1.0  # Simplified - just check it doesn't crash
+            operations_per_second=iterations * NS_PER_SEC / total_ns,
+            success_rate=successes / iterations
         )
     
     def test_large_expressions(self) -> Optional[PerformanceMetrics]:
@@ -448,78 +811,61 @@ class PerformanceTester:
             "(list " + " ".join(str(i) for i in range(50)) + ")",
         ]
         
-        times = []
-        successes = 0
-        start_time = time.time()
+        exprs = [expr for expr in large_expressions
+                 for i in range(min(5, self.iterations // len(large_expressions)))]
         
-        for expr in large_expressions:
-            for i in range(min(5, self.iterations // len(large_expressions))):
-                expr_start = time.time()
-                
-                proc = subprocess.run(
-                    [str(self.binary_path), "-c", expr],
-                    capture_output=True,
-                    text=True,
-                    timeout=30  # Longer timeout for large expressions
-                )
-                
-                expr_time = time.time() - expr_start
-                times.append(expr_time)
-                
-                if proc.returncode == 0:
-                    successes += 1
-        
-        total_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        times, successes = self._eval_many(exprs, timeout=30, workers=self.workers)  # Longer timeout for large expressions
+        total_ns = time.perf_counter_ns() - start_time
         
         if not times:
             return None
         
         return PerformanceMetrics(
             test_name="Large Expression Handling",
-            duration=total_time,
+            duration_ns=total_ns,
             memory_peak=0,
             memory_average=0,
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=len(times) / total_time,
-            success_rate=successes / len(times)
+            operations_per_second=len(times) * NS_PER_SEC / total_ns,
+            success_rate=successes / len(times),
+            **latency_percentiles(times)
         )
     
     def test_stress_scenarios(self) -> Optional[PerformanceMetrics]:
         """Test stress scenarios"""
         stress_tests = [
             # Rapid fire commands
-            lambda: [subprocess.run([str(self.binary_path), "-c", "(+ 1 1)"], 
-                                  capture_output=True, timeout=5) for _ in range(10)],
+            lambda: self._eval_many(["(+ 1 1)"] * 10, timeout=5),
             
             # Complex nested expressions
-            lambda: [subprocess.run([str(self.binary_path), "-c", 
-                                   "(if (> (+ 1 2) (* 2 1)) (list 1 2 3) (list 4 5 6))"], 
-                                  capture_output=True, timeout=10) for _ in range(5)],
+            lambda: self._eval_many(
+                ["(if (> (+ 1 2) (* 2 1)) (list 1 2 3) (list 4 5 6))"] * 5, timeout=10),
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         total_operations = 0
         successes = 0
         
         for stress_test in stress_tests:
             try:
-                results = stress_test()
-                total_operations += len(results)
-                successes += sum(1 for r in results if r.returncode == 0)
+                times, test_successes = stress_test()
+                total_operations += len(times)
+                successes += test_successes
             except Exception as e:
                 self.logger.warning(f"Stress test failed: {e}")
         
-        total_time = time.time() - start_time
+        total_ns = time.perf_counter_ns() - start_time
         
         return PerformanceMetrics(
             test_name="Stress Testing",
-            duration=total_time,
+            duration_ns=total_ns,
             memory_peak=0,
             memory_average=0,
             cpu_peak=0,
             cpu_average=0,
-            operations_per_second=total_operations / total_time if total_time > 0 else 0,
+            operations_per_second=total_operations * NS_PER_SEC / total_ns if total_ns > 0 else 0,
             success_rate=successes / total_operations if total_operations > 0 else 0
         )
     
@@ -535,6 +881,11 @@ class PerformanceTester:
             self.logger.info(f"  Operations/sec: {result.operations_per_second:.2f}")
             self.logger.info(f"  Success rate: {result.success_rate:.1%}")
             
+            if result.latency_p50_ns > 0:
+                self.logger.info(f"  Latency min/p50/p95/p99: {result.latency_min_ns / 1e6:.2f}/"
+                                 f"{result.latency_p50_ns / 1e6:.2f}/{result.latency_p95_ns / 1e6:.2f}/"
+                                 f"{result.latency_p99_ns / 1e6:.2f}ms")
+            
             if result.memory_peak > 0:
                 self.logger.info(f"  Peak memory: {result.memory_peak // 1024 // 1024}MB")
         
@@ -543,41 +894,57 @@ class PerformanceTester:
             'timestamp': time.time(),
             'binary_path': str(self.binary_path),
             'iterations': self.iterations,
-            'results': [
-                {
-                    'test_name': r.test_name,
-                    'duration': r.duration,
-                    'memory_peak': r.memory_peak,
-                    'memory_average': r.memory_average,
-                    'cpu_peak': r.cpu_peak,
-                    'cpu_average': r.cpu_average,
-                    'operations_per_second': r.operations_per_second,
-                    'success_rate': r.success_rate
-                }
-                for r in self.results
-            ]
+            'results': [dict(asdict(r), duration=r.duration) for r in self.results]
         }
         
         report_path = Path("performance_report.json")
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+        else:
+            report_path.write_text(json.dumps(report_data, indent=2))
         
         self.logger.info(f"\nDetailed report saved to: {report_path}")
 
-def main():
+def _run_profiled(argv: List[str], output_dir: Optional[str]) -> int:
+    """Re-run this script under Scalene, writing perf_profile.json"""
+    profile_path = Path(output_dir or '.') / 'perf_profile.json'
+    harness_args = [arg for arg in argv if arg != '--profile']
+    
+    cmd = [sys.executable, '-m', 'scalene', '--cli', '--json',
+           '--outfile', str(profile_path), __file__, '---', *harness_args]
+    return subprocess.run(cmd).returncode
+
+def main(argv: Optional[List[str]] = None):
+    # Profiling the harness itself: `--profile` (or `make profile`) re-runs
+    # this script under Scalene (pip install scalene) and writes
+    # perf_profile.json. Scalene splits Python from native time per line and
+    # reports copy volume, which shows where the harness rather than the
+    # binary is spending time.
+    if argv is None:
+        argv = sys.argv[1:]
+    
     parser = argparse.ArgumentParser(description='MCP Debugger Performance Tests')
     parser.add_argument('--binary', required=True, help='Path to mcp-debugger executable')
     parser.add_argument('--iterations', type=int, default=100, help='Number of test iterations')
     parser.add_argument('--output', help='Output directory for reports')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Spread parsing and large expression tests across one session per CPU')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the test harness with Scalene (writes perf_profile.json)')
+    
+    args = parser.parse_args(argv)
     
-    args = parser.parse_args()
+    if args.profile:
+        if importlib.util.find_spec('scalene') is not None:
+            return _run_profiled(argv, args.output)
+        print("Scalene is not installed, running without profiling", file=sys.stderr)
     
     # Change to output directory if specified
     if args.output:
         os.chdir(args.output)
     
     # Run performance tests
-    tester = PerformanceTester(args.binary, args.iterations)
+    tester = PerformanceTester(args.binary, args.iterations, args.parallel)
     success = tester.run_all_tests()
     
     return 0 if success else 1
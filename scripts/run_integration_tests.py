@@ -19,11 +19,17 @@ import subprocess
 import tempfile
 import threading
 import argparse
+import asyncio
+import atexit
+import functools
 import logging
+import queue
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # =======================================
 # Test Configuration
@@ -38,17 +44,166 @@ class TestConfig:
     skip_llm_tests: bool = False
     skip_x64dbg_tests: bool = False
     mock_apis: bool = True
+    binary_exists: bool = field(init=False)
+    
+    def __post_init__(self):
+        # Checked once here rather than by each test that needs the binary
+        self.binary_exists = bool(self.binary_path) and Path(self.binary_path).is_file()
 
 # =======================================
 # Test Framework
 # =======================================
+_FMT = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s')
+
+TEST_CONFIG = {
+    "api_configs": {
+        "claude": {
+            "model": "claude-3-sonnet-20240229",
+            "endpoint": "https://api.anthropic.com/v1/messages"
+        }
+    },
+    "debug_config": {
+        "x64dbg_path": "C:\\x64dbg\\x64dbg.exe",
+        "auto_connect": False
+    },
+    "log_config": {
+        "level": 1,
+        "console_output": True
+    }
+}
+
+# Runs under timeouts shorter than this are waited for by polling, starting
+# at POLL_WAIT_INITIAL seconds between checks and backing off to POLL_WAIT_MAX
+POLL_WAIT_MAX_TIMEOUT = 5
+POLL_WAIT_INITIAL = 0.001
+POLL_WAIT_MAX = 0.02
+
+# Simple commands timed by test_performance_basic
+PERFORMANCE_COMMANDS = [f"(+ {i} {i+1})" for i in range(10)]
+
+def _write_tempfile(data: bytes, suffix: str = "") -> str:
+    """Write data to a new temporary file and return its path
+    
+    The binary reads these back straight away, so the whole payload goes out
+    in one write on the raw descriptor without a buffered file object.
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return path
+
+@functools.lru_cache(maxsize=1)
+def _config_fixture_path() -> str:
+    """Write TEST_CONFIG to a temporary file once, removed at exit"""
+    path = _write_tempfile(json.dumps(TEST_CONFIG).encode(), suffix='.json')
+    atexit.register(os.unlink, path)
+    return path
+
 class TestResult:
     def __init__(self, name: str):
         self.name = name
         self.passed = False
-        self.error_message = ""
+        self.exc: Optional[BaseException] = None
         self.duration = 0.0
         self.output = ""
+    
+    @property
+    def error_message(self) -> str:
+        # Rendered only when a failure is actually reported
+        return str(self.exc) if self.exc is not None else ""
+
+class REPLSession:
+    """Interactive binary session that evaluates one command per line
+    
+    Started without a command the binary runs its REPL, which prints a prompt
+    once it is ready for the next line, so a response is everything written
+    before the next prompt. Several commands may be in flight at once; output
+    past a prompt is kept for the following response. Errors go to stderr,
+    which is merged into stdout to keep them in order with the rest of the
+    response.
+    """
+    
+    PROMPT = re.compile(rb"mcp(?:\[dbg\])?> ")
+    
+    def __init__(self, binary_path: str, timeout: float):
+        self.timeout = timeout
+        self.proc = subprocess.Popen(
+            [binary_path, "-q"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0
+        )
+        
+        # Pipes cannot be polled with a timeout on Windows, so a reader thread
+        # feeds stdout through a queue instead
+        self._output: queue.Queue = queue.Queue()
+        self._pending = b''
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+        
+        try:
+            self._read_response()  # Initial prompt
+        except Exception:
+            self.close()
+            raise
+    
+    def _read_output(self):
+        fd = self.proc.stdout.fileno()
+        for chunk in iter(lambda: os.read(fd, 65536), b''):
+            self._output.put(chunk)
+        self._output.put(None)
+    
+    def _read_response(self) -> str:
+        """Read output up to the next prompt"""
+        deadline = time.monotonic() + self.timeout
+        data = self._pending
+        
+        while (prompt := self.PROMPT.search(data)) is None:
+            try:
+                chunk = self._output.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise TimeoutError(f"No REPL prompt within {self.timeout}s")
+            if chunk is None:
+                raise RuntimeError("REPL exited unexpectedly")
+            data += chunk
+        
+        self._pending = data[prompt.end():]
+        return data[:prompt.start()].decode(errors='replace')
+    
+    def send(self, command: str) -> Tuple[bool, str]:
+        """Evaluate one command, returning whether it succeeded and its output"""
+        return self.send_many([command])[0]
+    
+    def send_many(self, commands: List[str]) -> List[Tuple[bool, str]]:
+        """Evaluate commands written in one go, with a result per command
+        
+        The REPL reads a line at a time, so each response still ends at its
+        own prompt.
+        """
+        self.proc.stdin.write(b''.join(command.encode() + b'\n' for command in commands))
+        results = []
+        for _ in commands:
+            output = self._read_response()
+            ok = not any(line.startswith('Error: ') for line in output.splitlines())
+            results.append((ok, output))
+        return results
+    
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(b':quit\n')
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+        self.proc.stdin.close()
+        # The reader sees EOF once the child has exited; closing stdout under
+        # it could hand its descriptor number to an unrelated file
+        self._reader.join(timeout=5)
+        self.proc.stdout.close()
 
 class TestRunner:
     def __init__(self, config: TestConfig):
@@ -56,15 +211,25 @@ class TestRunner:
         self.results: List[TestResult] = []
         self.logger = self._setup_logging()
         
+        # Options shared by every one-off run of the binary
+        self._run_kw = dict(capture_output=True, timeout=config.timeout)
+        
+        # Shared session for tests that only evaluate commands, started on
+        # first use; a fresh process per command would mostly test startup
+        self._repl: Optional[REPLSession] = None
+        self._repl_lock = threading.Lock()
+        
     def _setup_logging(self) -> logging.Logger:
         logger = logging.getLogger('mcp_tests')
         logger.setLevel(logging.DEBUG if self.config.verbose else logging.INFO)
         
+        # The logger is process-wide; later runners reuse its handler rather
+        # than adding another and printing every line twice
+        if logger.handlers:
+            return logger
+        
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s: %(message)s'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FMT)
         logger.addHandler(handler)
         
         return logger
@@ -81,12 +246,11 @@ class TestRunner:
             self.logger.info(f"✓ {name} - PASSED")
         except Exception as e:
             result.passed = False
-            result.error_message = str(e)
-            self.logger.error(f"✗ {name} - FAILED: {e}")
+            result.exc = e
+            self.logger.error("✗ %s - FAILED: %s", name, e)
         finally:
             result.duration = time.time() - start_time
-            
-        self.results.append(result)
+        
         return result
     
     def run_all_tests(self) -> bool:
@@ -95,42 +259,65 @@ class TestRunner:
         self.logger.info(f"Platform: {self.config.platform}, Config: {self.config.config}")
         
         # Core functionality tests
-        self.run_test(self.test_binary_execution, "Binary Execution")
-        self.run_test(self.test_config_loading, "Configuration Loading")
-        self.run_test(self.test_sexpr_parser, "S-Expression Parser")
-        self.run_test(self.test_logging_system, "Logging System")
+        tests = [
+            (self.test_binary_execution, "Binary Execution"),
+            (self.test_config_loading, "Configuration Loading"),
+            (self.test_sexpr_parser, "S-Expression Parser"),
+            (self.test_logging_system, "Logging System"),
+        ]
         
         # API integration tests (with mocking)
         if not self.config.skip_llm_tests:
-            self.run_test(self.test_llm_api_mock, "LLM API (Mocked)")
-            self.run_test(self.test_llm_error_handling, "LLM Error Handling")
+            tests.append((self.test_llm_api_mock, "LLM API (Mocked)"))
+            tests.append((self.test_llm_error_handling, "LLM Error Handling"))
         
         # x64dbg bridge tests
         if not self.config.skip_x64dbg_tests:
-            self.run_test(self.test_x64dbg_bridge_mock, "x64dbg Bridge (Mocked)")
-        
-        # Memory analysis tests
-        self.run_test(self.test_memory_analysis, "Memory Analysis")
-        self.run_test(self.test_pattern_matching, "Pattern Matching")
+            tests.append((self.test_x64dbg_bridge_mock, "x64dbg Bridge (Mocked)"))
         
-        # Security tests
-        self.run_test(self.test_credential_storage, "Credential Storage")
-        self.run_test(self.test_api_key_validation, "API Key Validation")
-        
-        # Performance tests
-        self.run_test(self.test_performance_basic, "Basic Performance")
+        tests += [
+            # Memory analysis tests
+            (self.test_memory_analysis, "Memory Analysis"),
+            (self.test_pattern_matching, "Pattern Matching"),
+            
+            # Security tests
+            (self.test_credential_storage, "Credential Storage"),
+            (self.test_api_key_validation, "API Key Validation"),
+            
+            # Performance tests
+            (self.test_performance_basic, "Basic Performance"),
+            
+            # CLI/REPL tests
+            (self.test_cli_commands, "CLI Commands"),
+            (self.test_repl_session, "REPL Session"),
+        ]
         
-        # CLI/REPL tests
-        self.run_test(self.test_cli_commands, "CLI Commands")
-        self.run_test(self.test_repl_session, "REPL Session")
+        # The tests are independent and mostly wait on the binary, so run
+        # them side by side, with room for twice as many as there are CPUs
+        try:
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                futures = [executor.submit(self.run_test, func, name) for func, name in tests]
+                # Collected in submission order once all have finished, so the
+                # workers never share the results list
+                self.results.extend(future.result() for future in futures)
+        finally:
+            if self._repl is not None:
+                self._repl.close()
+                self._repl = None
         
         return self.print_summary()
     
     def print_summary(self) -> bool:
         """Print test summary and return success status"""
         total = len(self.results)
-        passed = sum(1 for r in self.results if r.passed)
-        failed = total - passed
+        failed_results: List[TestResult] = []
+        total_time = 0.0
+        for r in self.results:
+            total_time += r.duration
+            if not r.passed:
+                failed_results.append(r)
+        failed = len(failed_results)
+        passed = total - failed
         
         self.logger.info("\n" + "="*60)
         self.logger.info("TEST SUMMARY")
@@ -141,31 +328,109 @@ class TestRunner:
         
         if failed > 0:
             self.logger.info("\nFAILED TESTS:")
-            for result in self.results:
-                if not result.passed:
-                    self.logger.error(f"- {result.name}: {result.error_message}")
+            for result in failed_results:
+                self.logger.error(f"- {result.name}: {result.error_message}")
         
-        total_time = sum(r.duration for r in self.results)
         self.logger.info(f"\nTotal execution time: {total_time:.2f}s")
         
         return failed == 0
 
+    def send_command(self, command: str) -> Tuple[bool, str]:
+        """Run one command in the shared REPL session, returning success and output"""
+        return self.send_commands([command])[0]
+    
+    def send_commands(self, commands: List[str]) -> List[Tuple[bool, str]]:
+        """Run commands back to back in the shared REPL session"""
+        with self._repl_lock:
+            if self._repl is None:
+                self._repl = REPLSession(self.config.binary_path, self.config.timeout)
+            
+            try:
+                return self._repl.send_many(commands)
+            except Exception:
+                # The session state is unknown now; start over on next use
+                self._repl.close()
+                self._repl = None
+                raise
+    
+    async def _run_concurrently(self, commands: List[List[str]]) -> List[int]:
+        """Run independent invocations side by side, returning their exit codes"""
+        async def run_one(argv: List[str]) -> int:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                return await asyncio.wait_for(proc.wait(), self.config.timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(argv, self.config.timeout)
+        
+        return await asyncio.gather(*(run_one(argv) for argv in commands))
+    
+    def _run(self, args: List[str], capture_text: bool = False) -> subprocess.CompletedProcess:
+        """Run the binary once, capturing its output
+        
+        Output is left as bytes unless the caller inspects it as text.
+        """
+        return subprocess.run(args, text=capture_text, **self._run_kw)
+    
+    def _run_discard(self, args: List[str], env: Optional[Dict[str, str]] = None) -> int:
+        """Run the binary once without keeping its output, returning the exit code"""
+        if self.config.timeout >= POLL_WAIT_MAX_TIMEOUT:
+            return subprocess.run(
+                args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                timeout=self.config.timeout
+            ).returncode
+        
+        # With a short timeout the run is expected to be quick, so poll for
+        # the exit with a growing sleep rather than blocking in wait; with no
+        # pipes attached there is nothing that could fill up meanwhile
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        deadline = time.monotonic() + self.config.timeout
+        sleep = POLL_WAIT_INITIAL
+        while proc.poll() is None:
+            if time.monotonic() >= deadline:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(args, self.config.timeout)
+            time.sleep(sleep)
+            sleep = min(sleep * 2, POLL_WAIT_MAX)
+        return proc.returncode
+    
+    def _run_script(self, lines: List[str]) -> subprocess.CompletedProcess:
+        """Run lines as a script file in a single binary invocation
+        
+        The binary reports each failing line on stderr as "Line N: ...".
+        """
+        script_path = _write_tempfile(("\n".join(lines) + "\n").encode(), suffix='.mcp')
+        
+        try:
+            return self._run([self.config.binary_path, "-f", script_path], capture_text=True)
+        finally:
+            os.unlink(script_path)
+    
     # =======================================
     # Test Implementations
     # =======================================
     
     def test_binary_execution(self, result: TestResult):
         """Test that the main binary can be executed"""
-        if not self.config.binary_path or not os.path.exists(self.config.binary_path):
+        if not self.config.binary_exists:
             raise Exception("Binary not found or not specified")
         
         # Test help command
-        proc = subprocess.run(
-            [self.config.binary_path, "--help"],
-            capture_output=True,
-            text=True,
-            timeout=self.config.timeout
-        )
+        proc = self._run([self.config.binary_path, "--help"], capture_text=True)
         
         if proc.returncode != 0:
             raise Exception(f"Binary execution failed: {proc.stderr}")
@@ -178,42 +443,16 @@ class TestRunner:
     
     def test_config_loading(self, result: TestResult):
         """Test configuration file loading"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            test_config = {
-                "api_configs": {
-                    "claude": {
-                        "model": "claude-3-sonnet-20240229",
-                        "endpoint": "https://api.anthropic.com/v1/messages"
-                    }
-                },
-                "debug_config": {
-                    "x64dbg_path": "C:\\x64dbg\\x64dbg.exe",
-                    "auto_connect": False
-                },
-                "log_config": {
-                    "level": 1,
-                    "console_output": True
-                }
-            }
-            json.dump(test_config, f)
-            config_path = f.name
+        # Test config loading with the binary
+        proc = self._run(
+            [self.config.binary_path, "-c", f":config load {_config_fixture_path()}"],
+            capture_text=True
+        )
         
-        try:
-            # Test config loading with the binary
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", f":config load {config_path}"],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            if proc.returncode != 0:
-                raise Exception(f"Config loading failed: {proc.stderr}")
-            
-            result.output = proc.stdout
-            
-        finally:
-            os.unlink(config_path)
+        if proc.returncode != 0:
+            raise Exception(f"Config loading failed: {proc.stderr}")
+        
+        result.output = proc.stdout
     
     def test_sexpr_parser(self, result: TestResult):
         """Test S-Expression parser functionality"""
@@ -224,16 +463,9 @@ class TestRunner:
             "(log \"info\" \"test message\")"
         ]
         
-        for expr in test_expressions:
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", expr],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            if proc.returncode != 0:
-                raise Exception(f"S-Expression parsing failed for '{expr}': {proc.stderr}")
+        for expr, (ok, output) in zip(test_expressions, self.send_commands(test_expressions)):
+            if not ok:
+                raise Exception(f"S-Expression parsing failed for '{expr}': {output}")
         
         result.output = f"Successfully parsed {len(test_expressions)} expressions"
     
@@ -243,17 +475,12 @@ class TestRunner:
             log_file = os.path.join(tmpdir, "test.log")
             
             # Test logging command
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", f'(log "info" "integration test message")'],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
+            ok, output = self.send_command('(log "info" "integration test message")')
             
-            if proc.returncode != 0:
-                raise Exception(f"Logging test failed: {proc.stderr}")
+            if not ok:
+                raise Exception(f"Logging test failed: {output}")
             
-            result.output = proc.stdout
+            result.output = output
     
     def test_llm_api_mock(self, result: TestResult):
         """Test LLM API with mocked responses"""
@@ -263,12 +490,7 @@ class TestRunner:
         # Test with mock LLM request
         test_command = '(llm "Hello, this is a test prompt")'
         
-        proc = subprocess.run(
-            [self.config.binary_path, "-c", test_command],
-            capture_output=True,
-            text=True,
-            timeout=self.config.timeout
-        )
+        proc = self._run([self.config.binary_path, "-c", test_command], capture_text=True)
         
         # Should fail gracefully since no API key is set
         if "API key" not in proc.stderr and "not available" not in proc.stderr:
@@ -283,52 +505,36 @@ class TestRunner:
             '(llm "test" "invalid" "args")',  # Too many args
         ]
         
-        for scenario in error_scenarios:
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", scenario],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
+        returncodes = asyncio.run(self._run_concurrently(
+            [[self.config.binary_path, "-c", scenario] for scenario in error_scenarios]))
+        
+        for scenario, returncode in zip(error_scenarios, returncodes):
             # Should fail gracefully, not crash
-            if proc.returncode == 0:
+            if returncode == 0:
                 self.logger.warning(f"Expected failure for scenario: {scenario}")
     
     def test_x64dbg_bridge_mock(self, result: TestResult):
         """Test x64dbg bridge with mocked debugger"""
         # Test connection command (should fail gracefully)
-        proc = subprocess.run(
-            [self.config.binary_path, "-c", ":connect"],
-            capture_output=True,
-            text=True,
-            timeout=self.config.timeout
-        )
+        returncode = self._run_discard([self.config.binary_path, "-c", ":connect"])
         
         # Should handle connection failure gracefully
-        result.output = proc.stdout + proc.stderr
+        result.output = f"Exited with code {returncode}"
     
     def test_memory_analysis(self, result: TestResult):
         """Test memory analysis functionality"""
         # Create test binary data
         test_data = b"MZ\x90\x00\x03\x00\x00\x00\x04\x00\x00\x00\xff\xff" + b"A" * 100
         
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            f.write(test_data)
-            data_file = f.name
+        data_file = _write_tempfile(test_data)
         
         try:
             # Test would involve memory analysis if we had direct API access
             # For now, just verify the binary doesn't crash on memory-related commands
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", "(log \"info\" \"memory analysis test\")"],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
+            ok, output = self.send_command("(log \"info\" \"memory analysis test\")")
             
-            if proc.returncode != 0:
-                raise Exception(f"Memory analysis test failed: {proc.stderr}")
+            if not ok:
+                raise Exception(f"Memory analysis test failed: {output}")
             
         finally:
             os.unlink(data_file)
@@ -338,31 +544,23 @@ class TestRunner:
         # Test pattern matching expressions
         test_expr = '(if (parse-pattern "test" "testdata") "found" "not found")'
         
-        proc = subprocess.run(
-            [self.config.binary_path, "-c", test_expr],
-            capture_output=True,
-            text=True,
-            timeout=self.config.timeout
-        )
+        ok, output = self.send_command(test_expr)
         
         # Should execute without crashing
-        result.output = proc.stdout + proc.stderr
+        result.output = output
     
     def test_credential_storage(self, result: TestResult):
         """Test credential storage security"""
         # Test credential operations (should be safe to test)
         with tempfile.TemporaryDirectory() as tmpdir:
-            os.environ['MCP_CONFIG_DIR'] = tmpdir
+            # Passed to the child only; the tests share this process's
+            # environment
+            env = {**os.environ, 'MCP_CONFIG_DIR': tmpdir}
             
             # These commands should handle missing credentials gracefully
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", ":status"],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
+            returncode = self._run_discard([self.config.binary_path, "-c", ":status"], env=env)
             
-            result.output = proc.stdout
+            result.output = f"Exited with code {returncode}"
     
     def test_api_key_validation(self, result: TestResult):
         """Test API key validation"""
@@ -381,23 +579,17 @@ class TestRunner:
         start_time = time.time()
         
         # Run multiple simple commands
-        for i in range(10):
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", f"(+ {i} {i+1})"],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            if proc.returncode != 0:
-                raise Exception(f"Performance test iteration {i} failed")
+        proc = self._run_script(PERFORMANCE_COMMANDS)
+        
+        if proc.returncode != 0:
+            raise Exception(f"Performance test failed: {proc.stderr}")
         
         duration = time.time() - start_time
         
         if duration > 30:  # Should complete in reasonable time
             raise Exception(f"Performance test too slow: {duration:.2f}s")
         
-        result.output = f"Completed 10 operations in {duration:.2f}s"
+        result.output = f"Completed {len(PERFORMANCE_COMMANDS)} operations in {duration:.2f}s"
     
     def test_cli_commands(self, result: TestResult):
         """Test CLI command functionality"""
@@ -407,16 +599,9 @@ class TestRunner:
             # ":quit" would exit the process
         ]
         
-        for cmd in cli_commands:
-            proc = subprocess.run(
-                [self.config.binary_path, "-c", cmd],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
-            
-            if proc.returncode != 0:
-                self.logger.warning(f"CLI command '{cmd}' failed: {proc.stderr}")
+        for cmd, (ok, output) in zip(cli_commands, self.send_commands(cli_commands)):
+            if not ok:
+                self.logger.warning(f"CLI command '{cmd}' failed: {output}")
         
         result.output = f"Tested {len(cli_commands)} CLI commands"
     
@@ -430,17 +615,10 @@ class TestRunner:
 (log "info" "REPL test complete")
 """
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.mcp', delete=False) as f:
-            f.write(script_content)
-            script_path = f.name
+        script_path = _write_tempfile(script_content.encode(), suffix='.mcp')
         
         try:
-            proc = subprocess.run(
-                [self.config.binary_path, "-f", script_path],
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout
-            )
+            proc = self._run([self.config.binary_path, "-f", script_path], capture_text=True)
             
             if proc.returncode != 0:
                 raise Exception(f"REPL session test failed: {proc.stderr}")
@@ -453,7 +631,17 @@ class TestRunner:
 # =======================================
 # Main Entry Point
 # =======================================
-def main():
+def _default_binary_path(platform: str, config: str) -> Path:
+    project_root = Path(__file__).parent.parent
+    return project_root / "build" / platform / "src" / "cli" / config / "mcp-debugger.exe"
+
+@functools.cache
+def _autodetect_binary(platform: str, config: str) -> Optional[str]:
+    """Return the build output for platform/config if it exists"""
+    binary_path = _default_binary_path(platform, config)
+    return str(binary_path) if binary_path.exists() else None
+
+def _make_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description='MCP Debugger Integration Tests')
     parser.add_argument('--platform', choices=['x64', 'x86'], default='x64')
     parser.add_argument('--config', choices=['Debug', 'Release'], default='Release')
@@ -463,19 +651,20 @@ def main():
     parser.add_argument('--skip-llm', action='store_true', help='Skip LLM tests')
     parser.add_argument('--skip-x64dbg', action='store_true', help='Skip x64dbg tests')
     parser.add_argument('--no-mock', action='store_true', help='Disable API mocking')
-    
-    args = parser.parse_args()
+    return parser
+
+# Built once; main() may be called repeatedly when the module is imported
+_PARSER = _make_parser()
+
+def main():
+    args = _PARSER.parse_args()
     
     # Auto-detect binary path if not specified
     if not args.binary:
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent
-        binary_path = project_root / "build" / args.platform / "src" / "cli" / args.config / "mcp-debugger.exe"
-        
-        if binary_path.exists():
-            args.binary = str(binary_path)
-        else:
-            print(f"ERROR: Binary not found at {binary_path}")
+        args.binary = _autodetect_binary(args.platform, args.config)
+        
+        if args.binary is None:
+            print(f"ERROR: Binary not found at {_default_binary_path(args.platform, args.config)}")
             print("Please specify --binary path or ensure build completed successfully")
             return 1
     
@@ -14,18 +14,409 @@ import os
 import sys
 import re
 import json
+import mmap
+import shutil
 import subprocess
+import threading
 import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _dumps_indented(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _compile(patterns: List[Tuple]) -> List[Tuple]:
+    # Files are scanned as raw bytes; every pattern is plain ASCII
+    return [(re.compile(pattern.encode('ascii'), re.IGNORECASE), *rest)
+            for pattern, *rest in patterns]
+
+def _within_line(pattern: bytes) -> bytes:
+    # Source patterns are written for a single line but run over whole files;
+    # keep \s and negated classes from matching a newline ('.' never does)
+    pattern = re.sub(rb'(?<!\\)\[\^', rb'[^\\n', pattern)
+    return re.sub(rb'(?<!\\)\\s', rb'[^\\S\\n]', pattern)
+
+# Directories never descended into when walking the project
+EXCLUDED_DIRS = frozenset({'.git', 'build'})
+
+# Compiled outputs checked by the binary scan
+BINARY_SUFFIXES = frozenset({'.exe', '.dll'})
+
+# Security features and the dumpbin /headers text that shows each one
+BINARY_FEATURES = {
+    'ASLR': ('Dynamic base',),
+    'DEP': ('NX compatible',),
+    'SafeSEH': ('Safe SEH',),
+    'GS': ('/GS', 'Buffer Security Check'),
+}
+
+# Seconds dumpbin may take per binary
+DUMPBIN_TIMEOUT = 30
+
+# Vendored code is left out of the source scan only
+SOURCE_EXCLUDED_DIRS = frozenset({'third_party'})
+
+# Worker processes are only used for at least this many files, handed out
+# PARALLEL_CHUNKSIZE at a time
+PARALLEL_MIN_FILES = 64
+PARALLEL_CHUNKSIZE = 32
+
+# Findings stream to this file in the project root while scanning
+FINDINGS_REPORT = "security_report.jsonl"
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_SIZE = 64 * 1024
+
+# Bytes of a mapped file copied at a time, when lowercasing it to look for
+# credential keywords or counting its lines
+WINDOW_SIZE = 1024 * 1024
+
+# Dangerous function patterns
+DANGEROUS_PATTERNS = _compile([
+    (r'strcpy\s*\(', 'Use of unsafe strcpy function'),
+    (r'strcat\s*\(', 'Use of unsafe strcat function'),
+    (r'sprintf\s*\(', 'Use of unsafe sprintf function'),
+    (r'gets\s*\(', 'Use of unsafe gets function'),
+    (r'system\s*\(', 'Use of system() function - potential command injection'),
+    (r'eval\s*\(', 'Use of eval() function - code injection risk'),
+    (r'CreateProcess\w*\s*\([^)]*NULL', 'CreateProcess with potential NULL security descriptor'),
+    (r'memcpy\s*\([^,]*,[^,]*,\s*[^)]*\)', 'Potential buffer overflow in memcpy'),
+    (r'#include\s+<windows\.h>', 'Windows-specific code - ensure security best practices'),
+])
+
+# SQL injection patterns (if any database code)
+SQL_PATTERNS = _compile([
+    (r'SELECT\s+.*\+.*', 'Potential SQL injection - string concatenation'),
+    (r'INSERT\s+.*\+.*', 'Potential SQL injection - string concatenation'),
+    (r'UPDATE\s+.*\+.*', 'Potential SQL injection - string concatenation'),
+])
+
+# Path traversal patterns
+PATH_PATTERNS = _compile([
+    (r'fopen\s*\([^)]*[^"]\.\.', 'Potential path traversal in file operations'),
+])
+
+# Path traversal substrings; plain bytes.find beats the regex engine on these
+PATH_LITERALS = [
+    (literal, re.escape(literal).decode('ascii'), 'Potential path traversal vulnerability')
+    for literal in (b'../', b'..\\\\')
+]
+
+SOURCE_PATTERNS = DANGEROUS_PATTERNS + SQL_PATTERNS + PATH_PATTERNS
+
+# Each source pattern runs over the whole file in its own pass, so no pattern's
+# match can hide another's; the scanning variant stays within one line
+SOURCE_SCANNERS = [
+    (re.compile(_within_line(pattern.pattern), re.IGNORECASE),
+     pattern.pattern.decode('ascii'), description)
+    for pattern, description in SOURCE_PATTERNS
+]
+
+# Credential patterns, each with a lowercase literal it cannot match without
+# (or None); most files contain none of them, so the regex is skipped there
+CREDENTIAL_PATTERNS = _compile([
+    (r'password\s*=\s*["\'][^"\']{3,}["\']', 'Hardcoded password', b'password'),
+    (r'api[_-]?key\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded API key', b'api'),
+    (r'secret\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded secret', b'secret'),
+    (r'token\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded token', b'token'),
+    (r'sk-[a-zA-Z0-9]{32,}', 'OpenAI API key pattern', b'sk-'),
+    (r'xai-[a-zA-Z0-9]{64}', 'Anthropic API key pattern', b'xai-'),
+    (r'AIza[a-zA-Z0-9_-]{35}', 'Google API key pattern', b'aiza'),
+    (r'-----BEGIN\\s+(RSA\\s+)?PRIVATE\\s+KEY-----', 'Private key', b'-----begin'),
+    (r'["\'][a-zA-Z0-9+/]{40,}={0,2}["\']', 'Potential base64 encoded secret', None),
+])
+
+CREDENTIAL_KEYWORDS = tuple(keyword for _, _, keyword in CREDENTIAL_PATTERNS if keyword)
+
+# Lines mentioning any of these hold obvious test/example values
+CREDENTIAL_SKIP = re.compile(rb'example|test|sample|placeholder|your-key', re.IGNORECASE)
+
+# External packages pulled in by CMake (find_package or vcpkg_install)
+DEPENDENCY_PATTERN = re.compile(rb'(?:find_package|vcpkg_install)\s*\(\s*([^)\s]+)', re.IGNORECASE)
+
+# Known vulnerable packages (simplified), by lowercase name
+KNOWN_VULNERABLE = {
+    b'openssl': 'Check OpenSSL version for known CVEs',
+    b'curl': 'Check libcurl version for known CVEs',
+    b'zlib': 'Check zlib version for known CVEs',
+}
+
+# Insecure configuration settings: key -> (insecure value, description)
+INSECURE_CONFIG_SETTINGS = {
+    'validate_ssl': (False, 'SSL validation disabled'),
+    'debug': (True, 'Debug mode enabled in production config'),
+    'log_level': ('debug', 'Debug logging enabled'),
+    'auto_connect': (True, 'Auto-connect enabled (security risk)'),
+}
+
+# The same settings matched textually, for config files that are not JSON
+INSECURE_CONFIG_PATTERNS = _compile([
+    (rf'"{key}"\s*:\s*{json.dumps(value)}', description)
+    for key, (value, description) in INSECURE_CONFIG_SETTINGS.items()
+])
+
+class _LineCounter:
+    """Line numbers for match offsets into content
+    
+    Offsets from one finditer pass only grow, so each lookup counts just the
+    newlines since the previous one; a smaller offset starts over.
+    """
+    
+    def __init__(self, content):
+        self.content = content
+        self.offset = 0
+        self.line = 1
+    
+    def line_at(self, offset: int) -> int:
+        if offset < self.offset:
+            self.offset, self.line = 0, 1
+        
+        if isinstance(self.content, bytes):
+            self.line += self.content.count(b'\n', self.offset, offset)
+        else:
+            # mmap has no count(); copy the gap a window at a time
+            for start in range(self.offset, offset, WINDOW_SIZE):
+                self.line += self.content[start:min(start + WINDOW_SIZE, offset)].count(b'\n')
+        
+        self.offset = offset
+        return self.line
+
+def _line_bounds(content, match: re.Match) -> Tuple[int, int]:
+    """Start and end offsets of the full line(s) a match falls on"""
+    start = content.rfind(b'\n', 0, match.start()) + 1
+    end = content.find(b'\n', match.end())
+    return start, end if end != -1 else len(content)
+
+def _insecure_settings(config) -> List[str]:
+    """Descriptions of the INSECURE_CONFIG_SETTINGS found anywhere in config"""
+    found = set()
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                setting = INSECURE_CONFIG_SETTINGS.get(key.lower())
+                if setting is not None:
+                    insecure = setting[0]
+                    # Compared by identity so that 1 and 0 do not pass for booleans
+                    if value is insecure or (isinstance(value, str) and value.lower() == insecure):
+                        found.add(key.lower())
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+    
+    return [description for key, (_, description) in INSECURE_CONFIG_SETTINGS.items() if key in found]
+
+@contextmanager
+def _read_content(file_path: str):
+    """A file's contents as bytes, memory-mapped rather than copied when large"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+def _keywords_in(content, keywords: Tuple[bytes, ...]) -> set:
+    """The keywords that occur in content, ignoring ASCII case
+    
+    Content is lowercased a window at a time so a mapped file is never
+    copied whole; windows overlap enough not to miss a keyword on the seam.
+    """
+    overlap = max(map(len, keywords)) - 1
+    found = set()
+    for start in range(0, len(content), WINDOW_SIZE):
+        window = content[max(start - overlap, 0):start + WINDOW_SIZE].lower()
+        found.update(keyword for keyword in keywords if keyword in window)
+    return found
+
+def _dumpbin_features(dumpbin: str, binary_path: str) -> Optional[Dict[str, bool]]:
+    """Which BINARY_FEATURES dumpbin /headers reports, or None if it failed
+    
+    The output is read line by line and dumpbin is stopped as soon as every
+    feature has turned up.
+    """
+    features = dict.fromkeys(BINARY_FEATURES, False)
+    
+    with subprocess.Popen(
+        [dumpbin, '/headers', binary_path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors='replace'
+    ) as proc:
+        timer = threading.Timer(DUMPBIN_TIMEOUT, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                for feature, markers in BINARY_FEATURES.items():
+                    if not features[feature] and any(marker in line for marker in markers):
+                        features[feature] = True
+                
+                if all(features.values()):
+                    proc.kill()
+                    return features
+            proc.wait()
+        finally:
+            timer.cancel()
+    
+    # Also non-zero when the timer killed it
+    return features if proc.returncode == 0 else None
+
+def _walk(root, excluded_dirs: frozenset = frozenset()):
+    """Yield a DirEntry for every file under root, skipping excluded_dirs
+    
+    Like os.walk, symlinked directories are not descended into.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink() and entry.name not in excluded_dirs:
+                    yield from _walk(entry.path, excluded_dirs)
+            else:
+                yield entry
+
+def _index_files(root, excluded_dirs: frozenset = frozenset()) -> Dict[str, List[str]]:
+    """Group the file paths under root by lowercase suffix, skipping excluded_dirs"""
+    files = defaultdict(list)
+    for entry in _walk(root, excluded_dirs):
+        files[os.path.splitext(entry.name)[1].lower()].append(entry.path)
+    return files
+
+# Per-file scans, run in worker processes for larger trees. Each takes a
+# file's contents and returns its findings, with 'file' left for the caller.
+
+def _scan_source(content) -> List[Dict]:
+    findings = []
+    lines = _LineCounter(content)
+    
+    # Matches of every pattern in file order, so lines are counted in one pass
+    matches = sorted(
+        (match.start(), index)
+        for index, (scanner, _, _) in enumerate(SOURCE_SCANNERS)
+        for match in scanner.finditer(content)
+    )
+    
+    # Each pattern is reported at most once per line
+    seen = set()
+    for start, index in matches:
+        line_num = lines.line_at(start)
+        if (line_num, index) in seen:
+            continue
+        seen.add((line_num, index))
+        
+        _, pattern, description = SOURCE_SCANNERS[index]
+        findings.append({
+            'type': 'code_vulnerability',
+            'severity': 'medium',
+            'file': None,
+            'line': line_num,
+            'description': description,
+            'pattern': pattern
+        })
+    
+    for literal, pattern, description in PATH_LITERALS:
+        lines = _LineCounter(content)
+        pos = content.find(literal)
+        while pos != -1:
+            findings.append({
+                'type': 'code_vulnerability',
+                'severity': 'medium',
+                'file': None,
+                'line': lines.line_at(pos),
+                'description': description,
+                'pattern': pattern
+            })
+            
+            # Once per line, so carry on from the next one
+            pos = content.find(b'\n', pos)
+            if pos != -1:
+                pos = content.find(literal, pos)
+    
+    return findings
+
+def _scan_credentials(content) -> List[Dict]:
+    findings = []
+    lines = _LineCounter(content)
+    
+    keywords = _keywords_in(content, CREDENTIAL_KEYWORDS)
+    
+    for pattern, description, keyword in CREDENTIAL_PATTERNS:
+        if keyword is not None and keyword not in keywords:
+            continue
+        
+        for match in pattern.finditer(content):
+            # Skip obvious test/example patterns
+            if CREDENTIAL_SKIP.search(content, *_line_bounds(content, match)):
+                continue
+            
+            text = match.group().decode('ascii', 'replace')
+            findings.append({
+                'type': 'credential_leak',
+                'severity': 'high',
+                'file': None,
+                'line': lines.line_at(match.start()),
+                'description': description,
+                'match': text[:20] + '...' if len(text) > 20 else text
+            })
+    
+    return findings
+
+# Findings by (scan, content digest); identical files such as vendored
+# copies are only scanned once per process
+_scan_cache: Dict[Tuple[str, bytes], List[Dict]] = {}
+
+def _scan_file(scan, file_path: str, project_root: str) -> Tuple[List[Dict], Optional[str]]:
+    """Run scan over one file, returning its findings and the error that
+    stopped the scan, if any"""
+    try:
+        rel_path = os.path.relpath(file_path, project_root)
+        with _read_content(file_path) as content:
+            key = (scan.__name__, hashlib.blake2b(content, digest_size=16).digest())
+            findings = _scan_cache.get(key)
+            if findings is None:
+                findings = _scan_cache[key] = scan(content)
+    except Exception as e:
+        return [], str(e)
+    
+    return [{**finding, 'file': rel_path} for finding in findings], None
+
 class SecurityScanner:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, jobs: Optional[int] = None):
         self.project_root = Path(project_root)
+        self._root = str(self.project_root)
+        self.jobs = jobs or os.cpu_count() or 1
+        self._files: Optional[Dict[str, List[str]]] = None
         self.logger = self._setup_logging()
-        self.findings = []
+        # Findings themselves only live in FINDINGS_REPORT, so memory stays
+        # bounded however many turn up
+        self._severity_counts = {'high': 0, 'medium': 0, 'low': 0}
+        self._findings_file = None
         
     def _setup_logging(self) -> logging.Logger:
         logger = logging.getLogger('mcp_security')
@@ -42,20 +433,26 @@ class SecurityScanner:
         """Run complete security scan"""
         self.logger.info("Starting MCP Debugger Security Scan")
         
-        # Code analysis
-        self.scan_source_code()
-        
-        # Credential leaks
-        self.scan_credential_leaks()
-        
-        # Dependency vulnerabilities
-        self.scan_dependencies()
-        
-        # Configuration security
-        self.scan_configurations()
-        
-        # Binary security features
-        self.scan_binary_security()
+        # Findings are written out as they are found, one JSON object per line
+        self._findings_file = open(self.project_root / FINDINGS_REPORT, 'wb')
+        try:
+            # Code analysis
+            self.scan_source_code()
+            
+            # Credential leaks
+            self.scan_credential_leaks()
+            
+            # Dependency vulnerabilities
+            self.scan_dependencies()
+            
+            # Configuration security
+            self.scan_configurations()
+            
+            # Binary security features
+            self.scan_binary_security()
+        finally:
+            self._findings_file.close()
+            self._findings_file = None
         
         # Generate report
         return self._generate_report()
@@ -64,141 +461,94 @@ class SecurityScanner:
         """Scan source code for security vulnerabilities"""
         self.logger.info("Scanning source code for vulnerabilities...")
         
-        # Dangerous function patterns
-        dangerous_patterns = [
-            (r'strcpy\s*\(', 'Use of unsafe strcpy function'),
-            (r'strcat\s*\(', 'Use of unsafe strcat function'),
-            (r'sprintf\s*\(', 'Use of unsafe sprintf function'),
-            (r'gets\s*\(', 'Use of unsafe gets function'),
-            (r'system\s*\(', 'Use of system() function - potential command injection'),
-            (r'eval\s*\(', 'Use of eval() function - code injection risk'),
-            (r'CreateProcess\w*\s*\([^)]*NULL', 'CreateProcess with potential NULL security descriptor'),
-            (r'memcpy\s*\([^,]*,[^,]*,\s*[^)]*\)', 'Potential buffer overflow in memcpy'),
-            (r'#include\s+<windows\.h>', 'Windows-specific code - ensure security best practices'),
-        ]
-        
-        # SQL injection patterns (if any database code)
-        sql_patterns = [
-            (r'SELECT\s+.*\+.*', 'Potential SQL injection - string concatenation'),
-            (r'INSERT\s+.*\+.*', 'Potential SQL injection - string concatenation'),
-            (r'UPDATE\s+.*\+.*', 'Potential SQL injection - string concatenation'),
-        ]
-        
-        # Path traversal patterns
-        path_patterns = [
-            (r'\.\./', 'Potential path traversal vulnerability'),
-            (r'\.\.\\\\', 'Potential path traversal vulnerability'),
-            (r'fopen\s*\([^)]*[^"]\.\.', 'Potential path traversal in file operations'),
-        ]
-        
-        all_patterns = dangerous_patterns + sql_patterns + path_patterns
-        
         # Scan all source files
         source_extensions = ['.cpp', '.hpp', '.c', '.h']
         
+        files = self._project_files()
+        file_paths = []
         for ext in source_extensions:
-            for file_path in self.project_root.rglob(f'*{ext}'):
-                if 'third_party' in str(file_path) or 'build' in str(file_path):
+            for file_path in files.get(ext, ()):
+                # Only directories inside the project count
+                rel_dir = os.path.relpath(os.path.dirname(file_path), self._root)
+                if SOURCE_EXCLUDED_DIRS.intersection(rel_dir.split(os.sep)):
                     continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        
-                    for line_num, line in enumerate(content.split('\\n'), 1):
-                        for pattern, description in all_patterns:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                self.findings.append({
-                                    'type': 'code_vulnerability',
-                                    'severity': 'medium',
-                                    'file': str(file_path.relative_to(self.project_root)),
-                                    'line': line_num,
-                                    'description': description,
-                                    'pattern': pattern
-                                })
-                
-                except Exception as e:
-                    self.logger.warning(f"Error scanning {file_path}: {e}")
+                file_paths.append(file_path)
+        
+        self._scan_files(partial(_scan_file, _scan_source), file_paths)
     
     def scan_credential_leaks(self):
         """Scan for hardcoded credentials and secrets"""
         self.logger.info("Scanning for credential leaks...")
         
-        # Credential patterns
-        credential_patterns = [
-            (r'password\s*=\s*["\'][^"\']{3,}["\']', 'Hardcoded password'),
-            (r'api[_-]?key\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded API key'),
-            (r'secret\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded secret'),
-            (r'token\s*[=:]\s*["\'][^"\']{10,}["\']', 'Hardcoded token'),
-            (r'sk-[a-zA-Z0-9]{32,}', 'OpenAI API key pattern'),
-            (r'xai-[a-zA-Z0-9]{64}', 'Anthropic API key pattern'),
-            (r'AIza[a-zA-Z0-9_-]{35}', 'Google API key pattern'),
-            (r'-----BEGIN\\s+(RSA\\s+)?PRIVATE\\s+KEY-----', 'Private key'),
-            (r'["\'][a-zA-Z0-9+/]{40,}={0,2}["\']', 'Potential base64 encoded secret'),
-        ]
-        
         # Files to scan
         scan_extensions = ['.cpp', '.hpp', '.c', '.h', '.json', '.txt', '.md', '.bat', '.ps1', '.py']
         
-        for ext in scan_extensions:
-            for file_path in self.project_root.rglob(f'*{ext}'):
-                if 'build' in str(file_path) or '.git' in str(file_path):
-                    continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    for line_num, line in enumerate(content.split('\\n'), 1):
-                        for pattern, description in credential_patterns:
-                            matches = re.finditer(pattern, line, re.IGNORECASE)
-                            for match in matches:
-                                # Skip obvious test/example patterns
-                                if any(keyword in line.lower() for keyword in ['example', 'test', 'sample', 'placeholder', 'your-key']):
-                                    continue
-                                
-                                self.findings.append({
-                                    'type': 'credential_leak',
-                                    'severity': 'high',
-                                    'file': str(file_path.relative_to(self.project_root)),
-                                    'line': line_num,
-                                    'description': description,
-                                    'match': match.group()[:20] + '...' if len(match.group()) > 20 else match.group()
-                                })
-                
-                except Exception as e:
-                    self.logger.warning(f"Error scanning {file_path}: {e}")
+        files = self._project_files()
+        file_paths = [file_path for ext in scan_extensions for file_path in files.get(ext, ())]
+        
+        self._scan_files(partial(_scan_file, _scan_credentials), file_paths)
+    
+    def _add(self, finding: Dict):
+        self._severity_counts[finding['severity']] += 1
+        if self._findings_file is not None:
+            self._findings_file.write(_dumps(finding) + b'\n')
+    
+    def _read_findings(self):
+        """Yield the findings written to FINDINGS_REPORT, in the order found"""
+        with open(self.project_root / FINDINGS_REPORT, 'rb') as f:
+            for line in f:
+                yield _loads(line)
+    
+    def _project_files(self) -> Dict[str, List[str]]:
+        """Project files by suffix, from a single walk shared by all scans"""
+        if self._files is None:
+            self._files = _index_files(self.project_root, EXCLUDED_DIRS)
+        return self._files
+    
+    def _scan_files(self, scan_file, file_paths: List[str]):
+        """Run a per-file scan over file_paths and collect its findings
+        
+        Larger batches are spread over worker processes, since the regex work
+        holds the GIL; small ones are not worth the pool startup.
+        """
+        if self.jobs > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                self._collect(file_paths, executor.map(
+                    scan_file, file_paths, repeat(self._root), chunksize=PARALLEL_CHUNKSIZE))
+        else:
+            self._collect(file_paths, map(scan_file, file_paths, repeat(self._root)))
+    
+    def _collect(self, file_paths: List[str], results):
+        for file_path, (findings, error) in zip(file_paths, results):
+            if error:
+                self.logger.warning(f"Error scanning {file_path}: {error}")
+            for finding in findings:
+                self._add(finding)
     
     def scan_dependencies(self):
         """Scan for vulnerable dependencies"""
         self.logger.info("Scanning dependencies for vulnerabilities...")
         
         # Check CMake files for external dependencies
-        cmake_files = list(self.project_root.rglob('CMakeLists.txt'))
+        cmake_files = [file_path for file_path in self._project_files().get('.txt', ())
+                       if os.path.basename(file_path) == 'CMakeLists.txt']
         
         for cmake_file in cmake_files:
             try:
-                with open(cmake_file, 'r') as f:
+                rel_path = os.path.relpath(cmake_file, self._root)
+                with open(cmake_file, 'rb') as f:
                     content = f.read()
                 
                 # Look for external package usage
-                external_deps = re.findall(r'find_package\\s*\\(\\s*([^)\\s]+)', content, re.IGNORECASE)
-                vcpkg_deps = re.findall(r'vcpkg_install\\s*\\(\\s*([^)\\s]+)', content, re.IGNORECASE)
-                
-                for dep in external_deps + vcpkg_deps:
-                    # Check against known vulnerable packages (simplified)
-                    known_vulnerable = {
-                        'openssl': 'Check OpenSSL version for known CVEs',
-                        'curl': 'Check libcurl version for known CVEs',
-                        'zlib': 'Check zlib version for known CVEs',
-                    }
-                    
-                    if dep.lower() in known_vulnerable:
-                        self.findings.append({
+                for match in DEPENDENCY_PATTERN.finditer(content):
+                    advice = KNOWN_VULNERABLE.get(match[1].lower())
+                    if advice is not None:
+                        dep = match[1].decode('ascii', 'replace')
+                        self._add({
                             'type': 'dependency_vulnerability',
                             'severity': 'medium',
-                            'file': str(cmake_file.relative_to(self.project_root)),
-                            'description': f'Dependency {dep}: {known_vulnerable[dep.lower()]}',
+                            'file': rel_path,
+                            'description': f'Dependency {dep}: {advice}',
                             'dependency': dep
                         })
             
@@ -209,32 +559,33 @@ class SecurityScanner:
         """Scan configuration files for security issues"""
         self.logger.info("Scanning configuration files...")
         
-        config_files = list(self.project_root.rglob('*.json')) + list(self.project_root.rglob('config*'))
+        files = self._project_files()
+        config_files = list(files.get('.json', ()))
+        config_files += [file_path for ext, file_paths in files.items() if ext != '.json'
+                         for file_path in file_paths if os.path.basename(file_path).startswith('config')]
         
         for config_file in config_files:
-            if 'build' in str(config_file):
-                continue
-            
             try:
-                with open(config_file, 'r') as f:
+                rel_path = os.path.relpath(config_file, self._root)
+                with open(config_file, 'rb') as f:
                     content = f.read()
                 
                 # Check for insecure configurations
-                insecure_configs = [
-                    (r'"validate_ssl"\\s*:\\s*false', 'SSL validation disabled'),
-                    (r'"debug"\\s*:\\s*true', 'Debug mode enabled in production config'),
-                    (r'"log_level"\\s*:\\s*"debug"', 'Debug logging enabled'),
-                    (r'"auto_connect"\\s*:\\s*true', 'Auto-connect enabled (security risk)'),
-                ]
+                try:
+                    config = orjson.loads(content) if orjson is not None else json.loads(content)
+                except ValueError:
+                    descriptions = [description for pattern, description in INSECURE_CONFIG_PATTERNS
+                                    if pattern.search(content)]
+                else:
+                    descriptions = _insecure_settings(config)
                 
-                for pattern, description in insecure_configs:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        self.findings.append({
-                            'type': 'configuration_issue',
-                            'severity': 'low',
-                            'file': str(config_file.relative_to(self.project_root)),
-                            'description': description
-                        })
+                for description in descriptions:
+                    self._add({
+                        'type': 'configuration_issue',
+                        'severity': 'low',
+                        'file': rel_path,
+                        'description': description
+                    })
             
             except Exception as e:
                 self.logger.warning(f"Error scanning {config_file}: {e}")
@@ -251,48 +602,41 @@ class SecurityScanner:
         for build_dir in build_dirs:
             build_path = self.project_root / build_dir
             if build_path.exists():
-                binary_paths.extend(build_path.rglob('*.exe'))
-                binary_paths.extend(build_path.rglob('*.dll'))
+                for entry in _walk(build_path):
+                    if os.path.splitext(entry.name)[1].lower() not in BINARY_SUFFIXES:
+                        continue
+                    
+                    # Sized from the directory entry so the file is only
+                    # stat'ed once
+                    try:
+                        if entry.stat().st_size < 1024:  # Skip very small files
+                            continue
+                    except OSError as e:
+                        self.logger.warning(f"Error analyzing binary {entry.path}: {e}")
+                        continue
+                    binary_paths.append(entry.path)
+        
+        # dumpbin is Windows-specific; looked up once for all binaries
+        dumpbin = shutil.which('dumpbin') if os.name == 'nt' else None
         
         for binary_path in binary_paths:
-            if binary_path.stat().st_size < 1024:  # Skip very small files
-                continue
-            
             try:
+                rel_path = os.path.relpath(binary_path, self._root)
+                
                 # Check for basic security features using dumpbin (if available)
-                # This is Windows-specific
-                if os.name == 'nt':
-                    try:
-                        result = subprocess.run(
-                            ['dumpbin', '/headers', str(binary_path)],
-                            capture_output=True,
-                            text=True,
-                            timeout=30
-                        )
-                        
-                        if result.returncode == 0:
-                            headers = result.stdout
-                            
-                            # Check for security features
-                            security_features = {
-                                'ASLR': 'Dynamic base' in headers,
-                                'DEP': 'NX compatible' in headers,
-                                'SafeSEH': 'Safe SEH' in headers,
-                                'GS': '/GS' in headers or 'Buffer Security Check' in headers,
-                            }
-                            
-                            missing_features = [feature for feature, present in security_features.items() if not present]
-                            
-                            if missing_features:
-                                self.findings.append({
-                                    'type': 'binary_security',
-                                    'severity': 'medium',
-                                    'file': str(binary_path.relative_to(self.project_root)),
-                                    'description': f'Missing security features: {", ".join(missing_features)}'
-                                })
+                if dumpbin is not None:
+                    security_features = _dumpbin_features(dumpbin, binary_path)
                     
-                    except (subprocess.TimeoutExpired, FileNotFoundError):
-                        pass  # dumpbin not available
+                    if security_features is not None:
+                        missing_features = [feature for feature, present in security_features.items() if not present]
+                        
+                        if missing_features:
+                            self._add({
+                                'type': 'binary_security',
+                                'severity': 'medium',
+                                'file': rel_path,
+                                'description': f'Missing security features: {", ".join(missing_features)}'
+                            })
                 
                 # Basic PE header analysis (cross-platform)
                 with open(binary_path, 'rb') as f:
@@ -300,10 +644,10 @@ class SecurityScanner:
                     
                     # Check for debug information
                     if b'.pdb' in header or b'RSDS' in header:
-                        self.findings.append({
+                        self._add({
                             'type': 'binary_security',
                             'severity': 'low',
-                            'file': str(binary_path.relative_to(self.project_root)),
+                            'file': rel_path,
                             'description': 'Binary contains debug information'
                         })
             
@@ -316,30 +660,25 @@ class SecurityScanner:
         self.logger.info("SECURITY SCAN REPORT")
         self.logger.info("="*60)
         
-        # Group findings by severity
-        by_severity = {'high': [], 'medium': [], 'low': []}
-        for finding in self.findings:
-            by_severity[finding['severity']].append(finding)
-        
-        total_findings = len(self.findings)
+        summary = dict(self._severity_counts)
+        total_findings = sum(summary.values())
         
         if total_findings == 0:
             self.logger.info("✓ No security issues found!")
             return True
         
         # Print summary
-        for severity in ['high', 'medium', 'low']:
-            count = len(by_severity[severity])
+        for severity, count in summary.items():
             if count > 0:
                 self.logger.info(f"{severity.upper()}: {count} findings")
         
-        # Print detailed findings
-        for severity in ['high', 'medium', 'low']:
-            findings = by_severity[severity]
-            if not findings:
+        # Print detailed findings, reading them back once per severity
+        for severity, count in summary.items():
+            if not count:
                 continue
             
             self.logger.info(f"\\n{severity.upper()} SEVERITY FINDINGS:")
+            findings = (f for f in self._read_findings() if f['severity'] == severity)
             for i, finding in enumerate(findings, 1):
                 self.logger.info(f"  {i}. {finding['description']}")
                 self.logger.info(f"     File: {finding['file']}")
@@ -352,28 +691,38 @@ class SecurityScanner:
         report_data = {
             'timestamp': str(Path().absolute()),
             'total_findings': total_findings,
-            'summary': {severity: len(findings) for severity, findings in by_severity.items()},
-            'findings': self.findings
+            'summary': summary,
+            'findings_file': FINDINGS_REPORT
         }
         
+        # The findings list is copied over one finding at a time rather than
+        # built in memory; the layout matches an indented dump of the whole
         report_path = self.project_root / "security_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(_dumps_indented(report_data)[:-2])
+            f.write(b',\n  "findings": [')
+            separator = b'\n    '
+            for finding in self._read_findings():
+                f.write(separator)
+                f.write(_dumps_indented(finding).replace(b'\n', b'\n    '))
+                separator = b',\n    '
+            f.write(b'\n  ]\n}')
         
         self.logger.info(f"\\nDetailed report saved to: {report_path}")
         
         # Return True if no high severity issues
-        return len(by_severity['high']) == 0
+        return summary['high'] == 0
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description='MCP Debugger Security Scanner')
     parser.add_argument('--project-root', default='.', help='Project root directory')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', type=int, help='Worker processes for file scans (default: CPU count)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Create scanner
-    scanner = SecurityScanner(args.project_root)
+    scanner = SecurityScanner(args.project_root, jobs=args.jobs)
     
     if args.verbose:
         scanner.logger.setLevel(logging.DEBUG)
@@ -0,0 +1,83 @@
+/*
+ * Startup latency probe used by performance_tests.py on Linux
+ *
+ * Usage: startup_bench <binary> <runs> [args...]
+ *
+ * Spawns <binary> [args...] <runs> times with its stdio on /dev/null and
+ * prints one line per run:
+ *
+ *     <elapsed ns> <exit status> <peak RSS in KiB>
+ *
+ * Only the spawn and the wait for the child fall inside the timed window, so
+ * none of the Python-side process bookkeeping ends up in the measurement.
+ */
+
+#define _GNU_SOURCE
+#include <errno.h>
+#include <fcntl.h>
+#include <spawn.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/resource.h>
+#include <sys/wait.h>
+#include <time.h>
+
+extern char **environ;
+
+static long long now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (long long)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+
+int main(int argc, char *argv[]) {
+    if (argc < 3) {
+        fprintf(stderr, "usage: %s <binary> <runs> [args...]\n", argv[0]);
+        return 2;
+    }
+
+    int runs = atoi(argv[2]);
+
+    /* Child argv: the binary followed by any extra arguments */
+    char **child_argv = calloc((size_t)argc - 1, sizeof(char *));
+    if (!child_argv) {
+        perror("calloc");
+        return 1;
+    }
+    child_argv[0] = argv[1];
+    for (int i = 3; i < argc; ++i) {
+        child_argv[i - 2] = argv[i];
+    }
+
+    posix_spawn_file_actions_t actions;
+    posix_spawn_file_actions_init(&actions);
+    posix_spawn_file_actions_addopen(&actions, 0, "/dev/null", O_RDONLY, 0);
+    posix_spawn_file_actions_addopen(&actions, 1, "/dev/null", O_WRONLY, 0);
+    posix_spawn_file_actions_addopen(&actions, 2, "/dev/null", O_WRONLY, 0);
+
+    for (int run = 0; run < runs; ++run) {
+        pid_t pid;
+        int status;
+        struct rusage usage;
+
+        long long start = now_ns();
+        int err = posix_spawn(&pid, argv[1], &actions, NULL, child_argv, environ);
+        if (err != 0) {
+            fprintf(stderr, "posix_spawn %s: %s\n", argv[1], strerror(err));
+            return 1;
+        }
+        if (wait4(pid, &status, 0, &usage) < 0) {
+            perror("wait4");
+            return 1;
+        }
+        long long elapsed = now_ns() - start;
+
+        int exit_status = WIFEXITED(status) ? WEXITSTATUS(status) : 128 + WTERMSIG(status);
+        printf("%lld %d %ld\n", elapsed, exit_status, usage.ru_maxrss);
+    }
+
+    posix_spawn_file_actions_destroy(&actions);
+    free(child_argv);
+    return 0;
+}